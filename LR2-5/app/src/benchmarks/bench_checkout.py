@@ -0,0 +1,176 @@
+import argparse
+import asyncio
+import random
+import sys
+import time
+from collections import Counter
+from uuid import UUID, uuid4
+
+from benchmarks.common import (
+    DEFAULT_DATABASE_URL,
+    create_bench_engine,
+    recreate_schema,
+    summarize,
+)
+from dto.order_dto import OrderCreate
+from entities import Address, Order, Product, User, order_product
+from repositories.order_repository import OrderRepository
+from sqlalchemy import func, select
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+
+
+async def seed(engine: AsyncEngine, products: int, stock: int) -> dict:
+    user_id, address_id = uuid4(), uuid4()
+    product_ids = [uuid4() for _ in range(products)]
+    async with engine.begin() as conn:
+        await conn.execute(
+            User.__table__.insert(),
+            [{"id": user_id, "username": "buyer", "email": "buyer@example.com"}],
+        )
+        await conn.execute(
+            Address.__table__.insert(),
+            [
+                {
+                    "id": address_id,
+                    "user_id": user_id,
+                    "street": "1 Main St",
+                    "city": "Springfield",
+                    "country": "US",
+                }
+            ],
+        )
+        await conn.execute(
+            Product.__table__.insert(),
+            [
+                {"id": product_id, "name": f"hot{index}", "price": 1.0, "count": stock}
+                for index, product_id in enumerate(product_ids)
+            ],
+        )
+    return {"user_id": user_id, "address_id": address_id, "products": product_ids}
+
+
+class Checkout:
+    def __init__(self):
+        self.samples: list[float] = []
+        self.sold: Counter[UUID] = Counter()
+        self.placed = 0
+        self.rejected = 0
+        self.errors = 0
+
+    async def place(self, session_factory, order: OrderCreate) -> None:
+        started = time.perf_counter()
+        async with session_factory() as session:
+            try:
+                await OrderRepository(session).create(order)
+            except ValueError:
+                self.rejected += 1
+                return
+            except DBAPIError:
+                self.errors += 1
+                return
+        self.samples.append(time.perf_counter() - started)
+        self.placed += 1
+        self.sold.update(order.product_ids)
+
+
+async def worker(
+    session_factory,
+    checkout: Checkout,
+    data: dict,
+    args: argparse.Namespace,
+    seed_value: int,
+) -> None:
+    rng = random.Random(seed_value)
+    for _ in range(args.orders):
+        product_ids = rng.sample(
+            data["products"], rng.randint(1, min(args.max_items, len(data["products"])))
+        )
+        await checkout.place(
+            session_factory,
+            OrderCreate(
+                user_id=data["user_id"],
+                address_id=data["address_id"],
+                product_ids=product_ids,
+            ),
+        )
+
+
+async def verify(engine: AsyncEngine, checkout: Checkout, stock: int) -> list[str]:
+    async with engine.connect() as conn:
+        remaining = dict((await conn.execute(select(Product.id, Product.count))).all())
+        orders = (
+            await conn.execute(select(func.count()).select_from(Order))
+        ).scalar_one()
+        lines = (
+            await conn.execute(select(func.count()).select_from(order_product))
+        ).scalar_one()
+
+    problems = []
+    for product_id, count in remaining.items():
+        if count < 0:
+            problems.append(f"product {product_id} oversold: stock is {count}")
+        if stock - count != checkout.sold[product_id]:
+            problems.append(
+                f"product {product_id}: stock dropped by {stock - count}, "
+                f"orders hold {checkout.sold[product_id]}"
+            )
+    if orders != checkout.placed:
+        problems.append(f"{orders} orders stored, {checkout.placed} placed")
+    if lines < orders:
+        problems.append(f"{orders} orders but only {lines} order lines")
+    return problems
+
+
+async def main(args: argparse.Namespace) -> int:
+    engine = create_bench_engine(args.database_url)
+    await recreate_schema(engine)
+    data = await seed(engine, args.products, args.stock)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    checkout = Checkout()
+    started = time.perf_counter()
+    await asyncio.gather(
+        *(
+            worker(session_factory, checkout, data, args, args.seed + index)
+            for index in range(args.concurrency)
+        )
+    )
+    elapsed = time.perf_counter() - started
+    problems = await verify(engine, checkout, args.stock)
+    await engine.dispose()
+
+    attempts = checkout.placed + checkout.rejected + checkout.errors
+    print(
+        f"{attempts} checkouts in {elapsed:.1f} s ({attempts / elapsed:.1f}/s): "
+        f"{checkout.placed} placed, {checkout.rejected} out of stock, "
+        f"{checkout.errors} database errors"
+    )
+    print(
+        f"units sold: {sum(checkout.sold.values())} of "
+        f"{args.stock * args.products} in stock"
+    )
+    if checkout.samples:
+        stats = summarize(checkout.samples)
+        print(
+            f"placed order latency: p50 {stats['p50_ms']:.2f} ms, "
+            f"p95 {stats['p95_ms']:.2f} ms, p99 {stats['p99_ms']:.2f} ms"
+        )
+    for problem in problems:
+        print(f"INCONSISTENT {problem}")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Place concurrent orders for a few hot products and check "
+        "that stock is never oversold"
+    )
+    parser.add_argument("--database-url", default=DEFAULT_DATABASE_URL)
+    parser.add_argument("--products", type=int, default=3)
+    parser.add_argument("--stock", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--orders", type=int, default=20, help="per worker")
+    parser.add_argument("--max-items", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=0)
+    sys.exit(asyncio.run(main(parser.parse_args())))
@@ -0,0 +1,312 @@
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+from uuid import UUID, uuid4
+
+import httpx
+from benchmarks.bench_writes import seed
+from benchmarks.common import (
+    DEFAULT_DATABASE_URL,
+    create_bench_engine,
+    recreate_schema,
+    summarize,
+)
+from entities import User
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+SRC_DIR = Path(__file__).parent.parent
+
+WORKLOADS = {
+    "read": {"get_by_id": 1},
+    "list": {"list_deep_page": 1},
+    "write": {"write_burst": 1},
+    "mixed": {"get_by_id": 70, "list_deep_page": 20, "write_burst": 10},
+}
+
+
+class Recorder:
+    def __init__(self):
+        self.samples: dict[str, list[float]] = defaultdict(list)
+        self.errors: dict[str, int] = defaultdict(int)
+
+    async def call(
+        self, client: httpx.AsyncClient, route: str, method: str, url: str, **kwargs
+    ):
+        started = time.perf_counter()
+        try:
+            response = await client.request(method, url, **kwargs)
+        except httpx.HTTPError:
+            self.errors[route] += 1
+            return None
+        self.samples[route].append(time.perf_counter() - started)
+        if response.status_code >= 400:
+            self.errors[route] += 1
+        return response
+
+
+async def get_by_id(
+    client, recorder: Recorder, rng: random.Random, state: dict
+) -> None:
+    user_id = rng.choice(state["ids"])
+    await recorder.call(client, "GET /users/{user_id}", "GET", f"/users/{user_id}")
+
+
+async def list_deep_page(
+    client, recorder: Recorder, rng: random.Random, state: dict
+) -> None:
+    pages = max(len(state["ids"]) // state["page_size"], 1)
+    page = rng.randrange(pages // 2, pages)
+    await recorder.call(
+        client,
+        "GET /users",
+        "GET",
+        "/users",
+        params={"count": state["page_size"], "page": page},
+    )
+
+
+async def write_burst(
+    client, recorder: Recorder, rng: random.Random, state: dict
+) -> None:
+    suffix = uuid4().hex
+    response = await recorder.call(
+        client,
+        "POST /users",
+        "POST",
+        "/users",
+        json={
+            "username": f"load-{suffix}",
+            "email": f"load-{suffix}@example.com",
+            "description": "load test",
+        },
+    )
+    if response is None or response.status_code >= 400:
+        return
+    user_id = response.json()["id"]
+    await recorder.call(
+        client,
+        "PUT /users/{user_id}",
+        "PUT",
+        f"/users/{user_id}",
+        json={"description": "load test, updated"},
+    )
+    await recorder.call(
+        client, "DELETE /users/{user_id}", "DELETE", f"/users/{user_id}"
+    )
+
+
+OPERATIONS = {
+    "get_by_id": get_by_id,
+    "list_deep_page": list_deep_page,
+    "write_burst": write_burst,
+}
+
+
+async def worker(
+    base_url: str,
+    mix: dict[str, int],
+    state: dict,
+    recorder: Recorder,
+    seed_value: int,
+    deadline: float,
+) -> None:
+    rng = random.Random(seed_value)
+    names = list(mix)
+    weights = list(mix.values())
+    async with httpx.AsyncClient(base_url=base_url, timeout=30) as client:
+        while time.perf_counter() < deadline:
+            operation = OPERATIONS[rng.choices(names, weights)[0]]
+            await operation(client, recorder, rng, state)
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(database_url: str, port: int) -> subprocess.Popen:
+    env = os.environ | {"DATABASE_URL": database_url}
+    return subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "main:app",
+            "--host",
+            "127.0.0.1",
+            "--port",
+            str(port),
+            "--log-level",
+            "warning",
+            "--no-access-log",
+        ],
+        cwd=SRC_DIR,
+        env=env,
+    )
+
+
+async def wait_until_ready(base_url: str, timeout: float = 30) -> None:
+    deadline = time.perf_counter() + timeout
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        while time.perf_counter() < deadline:
+            try:
+                await client.get("/users", params={"count": 1})
+                return
+            except httpx.TransportError:
+                await asyncio.sleep(0.2)
+    raise RuntimeError(f"server at {base_url} did not start in {timeout} s")
+
+
+def database_path(database_url: str) -> str:
+    if database_url.startswith("sqlite") and ":///./" in database_url:
+        relative = database_url.split(":///", 1)[1]
+        return "sqlite+aiosqlite:///" + str((Path.cwd() / relative).resolve())
+    return database_url
+
+
+def git_commit() -> str | None:
+    result = subprocess.run(
+        ["git", "rev-parse", "--short", "HEAD"],
+        cwd=SRC_DIR,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    return result.stdout.strip() or None
+
+
+def report(recorder: Recorder, elapsed: float) -> dict[str, dict[str, float]]:
+    routes = {}
+    for route, samples in sorted(recorder.samples.items()):
+        routes[route] = summarize(samples) | {
+            "rps": len(samples) / elapsed,
+            "errors": recorder.errors[route],
+        }
+    return routes
+
+
+def print_routes(routes: dict[str, dict[str, float]], baseline: dict | None) -> None:
+    print(
+        f"{'route':<26}{'rps':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'errors':>8}"
+    )
+    for route, stats in routes.items():
+        print(
+            f"{route:<26}{stats['rps']:>10.1f}{stats['p50_ms']:>10.2f}"
+            f"{stats['p95_ms']:>10.2f}{stats['p99_ms']:>10.2f}{stats['errors']:>8}"
+        )
+        previous = (baseline or {}).get("routes", {}).get(route)
+        if previous:
+            print(
+                f"{'  vs ' + str(baseline.get('commit')):<26}"
+                f"{stats['rps'] / previous['rps'] - 1:>+10.1%}"
+                f"{stats['p50_ms'] / previous['p50_ms'] - 1:>+10.1%}"
+                f"{stats['p95_ms'] / previous['p95_ms'] - 1:>+10.1%}"
+                f"{stats['p99_ms'] / previous['p99_ms'] - 1:>+10.1%}"
+            )
+
+
+async def load_user_ids(database_url: str, args: argparse.Namespace) -> list[UUID]:
+    if not args.skip_seed:
+        engine = create_bench_engine(database_url)
+        await recreate_schema(engine)
+        session_factory = async_sessionmaker(engine, expire_on_commit=False)
+        await seed(session_factory, "seeded", args.users)
+        await engine.dispose()
+
+    engine = create_bench_engine(database_url)
+    async with engine.connect() as conn:
+        ids = list((await conn.execute(select(User.id))).scalars())
+    await engine.dispose()
+    return ids
+
+
+async def run_workload(
+    database_url: str, ids: list[UUID], args: argparse.Namespace
+) -> tuple[Recorder, float]:
+    port = free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    server = start_server(database_url, port)
+    try:
+        await wait_until_ready(base_url)
+        state = {"ids": ids, "page_size": args.page_size}
+        recorder = Recorder()
+        started = time.perf_counter()
+        deadline = started + args.duration
+        await asyncio.gather(
+            *(
+                worker(
+                    base_url,
+                    WORKLOADS[args.workload],
+                    state,
+                    recorder,
+                    args.seed + index,
+                    deadline,
+                )
+                for index in range(args.concurrency)
+            )
+        )
+        elapsed = time.perf_counter() - started
+    finally:
+        server.terminate()
+        server.wait()
+    return recorder, elapsed
+
+
+async def main(args: argparse.Namespace) -> None:
+    database_url = database_path(args.database_url)
+    ids = await load_user_ids(database_url, args)
+    recorder, elapsed = await run_workload(database_url, ids, args)
+
+    routes = report(recorder, elapsed)
+    total = sum(len(samples) for samples in recorder.samples.values())
+    result = {
+        "commit": git_commit(),
+        "workload": args.workload,
+        "concurrency": args.concurrency,
+        "duration_s": elapsed,
+        "users": len(ids),
+        "database": database_url.split("://", 1)[0],
+        "rps": total / elapsed,
+        "routes": routes,
+    }
+
+    baseline = (
+        json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        if args.compare
+        else None
+    )
+    print_routes(routes, baseline)
+    print(f"total: {result['rps']:.1f} rps over {elapsed:.1f} s")
+    if args.output:
+        Path(args.output).write_text(json.dumps(result, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Run mixed HTTP workloads against the app under uvicorn"
+    )
+    parser.add_argument("--database-url", default=DEFAULT_DATABASE_URL)
+    parser.add_argument("--workload", choices=WORKLOADS, default="mixed")
+    parser.add_argument("--users", type=int, default=10_000)
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=20, help="seconds")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--skip-seed", action="store_true", help="reuse the existing database"
+    )
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument(
+        "--compare", help="JSON results of an earlier run to compare against"
+    )
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,71 @@
+import argparse
+import asyncio
+import time
+import tracemalloc
+
+from benchmarks.bench_writes import seed
+from benchmarks.common import DEFAULT_DATABASE_URL, create_bench_engine, recreate_schema
+from dto.trusted import encode_trusted
+from dto.user_dto import UserListResponse, UserResponse
+from repositories.count_strategy import CountStrategy
+from repositories.read_mode import ReadMode
+from repositories.user_repository import UserRepository
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+
+async def read_page(session_factory, page_size: int, read_mode: ReadMode) -> bytes:
+    async with session_factory() as session:
+        users, _, _ = await UserRepository(session).get_by_filter(
+            page_size, 0, count_strategy=CountStrategy.NONE, read_mode=read_mode
+        )
+        return encode_trusted(UserListResponse, users=UserResponse.to_structs(users))
+
+
+async def measure(
+    session_factory, page_size: int, read_mode: ReadMode, iterations: int
+) -> tuple[float, int]:
+    await read_page(session_factory, page_size, read_mode)
+    started = time.process_time()
+    for _ in range(iterations):
+        await read_page(session_factory, page_size, read_mode)
+    elapsed = (time.process_time() - started) / iterations
+
+    tracemalloc.start()
+    await read_page(session_factory, page_size, read_mode)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+async def main(args: argparse.Namespace) -> None:
+    engine = create_bench_engine(args.database_url)
+    await recreate_schema(engine)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    await seed(session_factory, "reader", args.page_size)
+
+    pages = {
+        mode: await read_page(session_factory, args.page_size, mode)
+        for mode in ReadMode
+    }
+    assert pages[ReadMode.ORM] == pages[ReadMode.CORE]
+
+    print(f"{'mode':<8}{'cpu ms/page':>14}{'cpu us/row':>12}{'peak KiB':>12}")
+    for mode in ReadMode:
+        elapsed, peak = await measure(
+            session_factory, args.page_size, mode, args.iterations
+        )
+        print(
+            f"{mode.value:<8}{elapsed * 1000:>14.3f}"
+            f"{elapsed / args.page_size * 1e6:>12.2f}{peak / 1024:>12.1f}"
+        )
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Compare ORM and Core read paths for one page of users"
+    )
+    parser.add_argument("--database-url", default=DEFAULT_DATABASE_URL)
+    parser.add_argument("--page-size", type=int, default=1000)
+    parser.add_argument("--iterations", type=int, default=50)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,339 @@
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import sys
+import time
+import uuid
+from collections import defaultdict
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from benchmarks.common import DEFAULT_DATABASE_URL, create_bench_engine, recreate_schema
+from dto.order_dto import OrderCreate
+from dto.produc_dto import ProductCreate, ProductUpdate
+from dto.user_dto import UserCreate, UserUpdate
+from entities import Address, Order, Product, User, UserOrderStats, order_product
+from repositories.order_repository import OrderRepository
+from repositories.product_repository import ProductRepository
+from repositories.user_repository import UserRepository
+from sqlalchemy import Table
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+
+CHUNK_SIZE = 10_000
+EPOCH = datetime(2024, 1, 1)
+STOCK = 1_000_000
+SAMPLE_SIZE = 1_000
+WORDS = ("engineer", "designer", "coffee", "travel", "novel", "robotics", "seo")
+
+
+class Dataset:
+    def __init__(self, seed: int):
+        self.rng = random.Random(seed)
+        self.size = 0
+        self.samples: dict[str, list[Any]] = {
+            "users": [],
+            "buyers": [],
+            "products": [],
+            "orders": [],
+        }
+
+    def new_id(self) -> uuid.UUID:
+        return uuid.UUID(int=self.rng.getrandbits(128), version=4)
+
+    def remember(self, table: str, entity_id: Any, index: int) -> None:
+        sample = self.samples[table]
+        if len(sample) < SAMPLE_SIZE:
+            sample.append(entity_id)
+        else:
+            slot = self.rng.randrange(index + 1)
+            if slot < SAMPLE_SIZE:
+                sample[slot] = entity_id
+
+    def pick(self, table: str) -> Any:
+        return self.rng.choice(self.samples[table])
+
+    def entity_rows(self, index: int) -> dict[Table, dict]:
+        created_at = EPOCH + timedelta(seconds=index)
+        stamps = {"created_at": created_at, "updated_at": created_at}
+        user_id, address_id = self.new_id(), self.new_id()
+        product_id, order_id = self.new_id(), self.new_id()
+        price = round(self.rng.uniform(1, 500), 2)
+        rows = {
+            User.__table__: {
+                "id": user_id,
+                "username": f"user{index}",
+                "email": f"user{index}@example.com",
+                "description": " ".join(self.rng.sample(WORDS, 3)),
+                **stamps,
+            },
+            Address.__table__: {
+                "id": address_id,
+                "user_id": user_id,
+                "street": f"{index} Main St",
+                "city": "Springfield",
+                "country": "US",
+                **stamps,
+            },
+            Product.__table__: {
+                "id": product_id,
+                "name": f"product{index}",
+                "price": price,
+                "count": STOCK,
+                **stamps,
+            },
+            Order.__table__: {
+                "id": order_id,
+                "user_id": user_id,
+                "address_id": address_id,
+                "product_id": product_id,
+                "total": price,
+                **stamps,
+            },
+            order_product: {"order_id": order_id, "product_id": product_id},
+            UserOrderStats.__table__: {
+                "user_id": user_id,
+                "order_count": 1,
+                "total_spent": price,
+                "last_order_at": created_at,
+                "updated_at": created_at,
+            },
+        }
+        for table, entity_id in (
+            ("users", user_id),
+            ("buyers", (user_id, address_id)),
+            ("products", product_id),
+            ("orders", order_id),
+        ):
+            self.remember(table, entity_id, index)
+        return rows
+
+    async def grow(self, engine: AsyncEngine, size: int) -> None:
+        for start in range(self.size, size, CHUNK_SIZE):
+            chunk: dict[Table, list[dict]] = defaultdict(list)
+            for index in range(start, min(start + CHUNK_SIZE, size)):
+                for table, row in self.entity_rows(index).items():
+                    chunk[table].append(row)
+            async with engine.begin() as conn:
+                for table, rows in chunk.items():
+                    await conn.execute(table.insert(), rows)
+        self.size = size
+
+
+def unique_user() -> UserCreate:
+    suffix = uuid.uuid4().hex
+    return UserCreate(
+        username=f"bench-{suffix}", email=f"bench-{suffix}@example.com", description=""
+    )
+
+
+def new_order(dataset: Dataset) -> OrderCreate:
+    user_id, address_id = dataset.pick("buyers")
+    return OrderCreate(
+        user_id=user_id,
+        address_id=address_id,
+        product_ids=dataset.rng.sample(dataset.samples["products"], 3),
+    )
+
+
+def scenarios(dataset: Dataset) -> dict:
+    deep_page = max(dataset.size // 20 - 1, 0)
+    return {
+        "UserRepository.get_by_id": lambda s: UserRepository(s).get_by_id(
+            dataset.pick("users")
+        ),
+        "UserRepository.get_by_filter(first page)": lambda s: UserRepository(
+            s
+        ).get_by_filter(20, 0),
+        "UserRepository.get_by_filter(deep page)": lambda s: UserRepository(
+            s
+        ).get_by_filter(20, deep_page),
+        "UserRepository.get_by_cursor": lambda s: UserRepository(s).get_by_cursor(20),
+        "UserRepository.get_many(100)": lambda s: UserRepository(s).get_many(
+            dataset.rng.sample(dataset.samples["users"], 100)
+        ),
+        "UserRepository.get_list_version": lambda s: UserRepository(
+            s
+        ).get_list_version(),
+        "UserRepository.search": lambda s: UserRepository(s).search("coffee", 20),
+        "UserRepository.create": lambda s: UserRepository(s).create(unique_user()),
+        "UserRepository.create_many(100)": lambda s: UserRepository(s).create_many(
+            [unique_user() for _ in range(100)]
+        ),
+        "UserRepository.update": lambda s: UserRepository(s).update(
+            dataset.pick("users"), UserUpdate(description="updated")
+        ),
+        "UserRepository.delete(missing id)": lambda s: UserRepository(s).delete(
+            uuid.uuid4()
+        ),
+        "ProductRepository.get_by_id": lambda s: ProductRepository(s).get_by_id(
+            dataset.pick("products")
+        ),
+        "ProductRepository.get_all(deep page)": lambda s: ProductRepository(s).get_all(
+            20, deep_page
+        ),
+        "ProductRepository.create": lambda s: ProductRepository(s).create(
+            ProductCreate(name="bench", price=1.0, count=1)
+        ),
+        "ProductRepository.update": lambda s: ProductRepository(s).update(
+            dataset.pick("products"),
+            ProductUpdate(price=round(dataset.rng.uniform(1, 500), 2)),
+        ),
+        "ProductRepository.delete(missing id)": lambda s: ProductRepository(s).delete(
+            uuid.uuid4()
+        ),
+        "OrderRepository.get_by_id": lambda s: OrderRepository(s).get_by_id(
+            dataset.pick("orders")
+        ),
+        "OrderRepository.get_all(deep page)": lambda s: OrderRepository(s).get_all(
+            20, deep_page
+        ),
+        "OrderRepository.get_by_user": lambda s: OrderRepository(s).get_by_user(
+            dataset.pick("users")
+        ),
+        "OrderRepository.get_page_by_user": lambda s: OrderRepository(
+            s
+        ).get_page_by_user(dataset.pick("users"), 20),
+        "OrderRepository.create(3 products)": lambda s: OrderRepository(s).create(
+            new_order(dataset)
+        ),
+        "OrderRepository.delete(missing id)": lambda s: OrderRepository(s).delete(
+            uuid.uuid4()
+        ),
+    }
+
+
+async def measure(session_factory, name: str, operation, repeat: int) -> float | None:
+    samples = []
+    for _ in range(repeat):
+        async with session_factory() as session:
+            started = time.perf_counter()
+            try:
+                await operation(session)
+            except (ValueError, SQLAlchemyError) as error:
+                print(f"ERROR {name}: {error!r}", file=sys.stderr)
+                return None
+            samples.append(time.perf_counter() - started)
+    return statistics.median(samples) * 1000
+
+
+def print_results(results: dict[int, dict[str, float | None]]) -> None:
+    scales = list(results)
+    methods = list(results[scales[0]])
+    print(
+        f"{'method (median ms)':<44}"
+        + "".join(f"{scale:>12,}" for scale in scales)
+        + f"{'growth':>10}"
+    )
+    for method in methods:
+        values = [results[scale][method] for scale in scales]
+        cells = "".join(
+            f"{value:>12.3f}" if value is not None else f"{'error':>12}"
+            for value in values
+        )
+        growth = (
+            f"{values[-1] / values[0]:>9.1f}x"
+            if None not in values and values[0]
+            else f"{'-':>10}"
+        )
+        print(f"{method:<44}{cells}{growth}")
+
+
+def check_regressions(
+    results: dict[int, dict[str, float | None]],
+    baseline: dict | None,
+    max_regression: float,
+    max_growth: float | None,
+) -> list[str]:
+    failures = []
+    scales = list(results)
+    for method in results[scales[0]]:
+        first, last = results[scales[0]][method], results[scales[-1]][method]
+        if (
+            max_growth is not None
+            and first
+            and last is not None
+            and last / first > max_growth
+        ):
+            failures.append(
+                f"{method}: {last / first:.1f}x slower at {scales[-1]:,} rows "
+                f"than at {scales[0]:,} (limit {max_growth}x)"
+            )
+        for scale in scales:
+            previous = (baseline or {}).get(str(scale), {}).get(method)
+            current = results[scale][method]
+            if current is None:
+                failures.append(f"{method} at {scale:,} rows: failed")
+            elif previous and current > previous * (1 + max_regression):
+                failures.append(
+                    f"{method} at {scale:,} rows: {current:.3f} ms vs "
+                    f"{previous:.3f} ms baseline (limit +{max_regression:.0%})"
+                )
+    return failures
+
+
+async def main(args: argparse.Namespace) -> int:
+    engine = create_bench_engine(args.database_url)
+    await recreate_schema(engine)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    dataset = Dataset(args.seed)
+
+    results: dict[int, dict[str, float | None]] = {}
+    for scale in sorted(args.scales):
+        started = time.perf_counter()
+        await dataset.grow(engine, scale)
+        print(
+            f"seeded {scale:,} rows per table in {time.perf_counter() - started:.1f} s"
+        )
+        results[scale] = {
+            name: await measure(session_factory, name, operation, args.repeat)
+            for name, operation in scenarios(dataset).items()
+        }
+    await engine.dispose()
+
+    print_results(results)
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+    baseline = (
+        json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        if args.baseline
+        else None
+    )
+    failures = check_regressions(
+        results, baseline, args.max_regression, args.max_growth
+    )
+    for failure in failures:
+        print(f"REGRESSION {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Time every public repository method at growing data sizes"
+    )
+    parser.add_argument("--database-url", default=DEFAULT_DATABASE_URL)
+    parser.add_argument(
+        "--scales", type=int, nargs="+", default=[10_000, 100_000, 1_000_000]
+    )
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write median timings as JSON to this file")
+    parser.add_argument(
+        "--baseline", help="JSON from an earlier run to compare against"
+    )
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=0.25,
+        help="allowed slowdown against the baseline, as a fraction",
+    )
+    parser.add_argument(
+        "--max-growth",
+        type=float,
+        help="allowed slowdown between the smallest and largest scale",
+    )
+    sys.exit(asyncio.run(main(parser.parse_args())))
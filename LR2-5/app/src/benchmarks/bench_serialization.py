@@ -0,0 +1,78 @@
+import argparse
+import json
+import time
+import tracemalloc
+import uuid
+from datetime import datetime
+
+from dto.trusted import encode_trusted
+from dto.user_dto import UserListResponse, UserResponse
+from entities import User
+from litestar.plugins.pydantic import PydanticInitPlugin
+from litestar.serialization import encode_json, get_serializer
+
+serializer = get_serializer(PydanticInitPlugin.encoders())
+
+
+def make_users(count: int) -> list[User]:
+    now = datetime.now()
+    return [
+        User(
+            id=uuid.uuid4(),
+            username=f"user{i}",
+            email=f"user{i}@example.com",
+            description="Software engineer passionate about clean code.",
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(count)
+    ]
+
+
+def validated(users: list[User]) -> bytes:
+    response = UserListResponse(
+        users=[UserResponse.model_validate(user) for user in users], total=len(users)
+    )
+    return encode_json(response, serializer=serializer)
+
+
+def trusted(users: list[User]) -> bytes:
+    return encode_trusted(
+        UserListResponse, users=UserResponse.to_structs(users), total=len(users)
+    )
+
+
+def measure(path, users: list[User], iterations: int) -> tuple[float, int]:
+    path(users)
+    started = time.perf_counter()
+    for _ in range(iterations):
+        path(users)
+    elapsed = (time.perf_counter() - started) / iterations
+
+    tracemalloc.start()
+    path(users)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main(args: argparse.Namespace) -> None:
+    users = make_users(args.page_size)
+    assert json.loads(validated(users)) == json.loads(trusted(users))
+
+    print(f"{'path':<12}{'ms/page':>10}{'us/row':>10}{'peak KiB':>12}")
+    for name, path in (("validated", validated), ("trusted", trusted)):
+        elapsed, peak = measure(path, users, args.iterations)
+        print(
+            f"{name:<12}{elapsed * 1000:>10.3f}"
+            f"{elapsed / args.page_size * 1e6:>10.2f}{peak / 1024:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Compare validated and trusted construction of list responses"
+    )
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--iterations", type=int, default=200)
+    main(parser.parse_args())
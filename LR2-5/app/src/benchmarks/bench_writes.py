@@ -0,0 +1,107 @@
+import argparse
+import asyncio
+import time
+from uuid import UUID
+
+from benchmarks.common import (
+    DEFAULT_DATABASE_URL,
+    create_bench_engine,
+    print_table,
+    recreate_schema,
+    summarize,
+)
+from dto.user_dto import UserCreate, UserUpdate
+from entities import User
+from repositories.user_repository import UserRepository
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+
+async def legacy_update(session: AsyncSession, user_id: UUID, data: UserUpdate):
+    user = (
+        await session.execute(select(User).where(User.id == user_id))
+    ).scalar_one_or_none()
+    for key, value in data.model_dump(exclude_unset=True).items():
+        setattr(user, key, value)
+    await session.commit()
+    await session.refresh(user)
+    return user
+
+
+async def legacy_delete(session: AsyncSession, user_id: UUID) -> None:
+    user = (
+        await session.execute(select(User).where(User.id == user_id))
+    ).scalar_one_or_none()
+    if user:
+        await session.delete(user)
+        await session.commit()
+
+
+async def seed(session_factory, prefix: str, count: int) -> list[UUID]:
+    async with session_factory() as session:
+        results = await UserRepository(session).create_many(
+            [
+                UserCreate(
+                    username=f"{prefix}{i}",
+                    email=f"{prefix}{i}@example.com",
+                    description="benchmark",
+                )
+                for i in range(count)
+            ]
+        )
+    return [row.id for row, _ in results]
+
+
+async def measure(session_factory, ids: list[UUID], operation) -> list[float]:
+    samples = []
+    for user_id in ids:
+        async with session_factory() as session:
+            started = time.perf_counter()
+            await operation(session, user_id)
+            samples.append(time.perf_counter() - started)
+    return samples
+
+
+async def main(args: argparse.Namespace) -> None:
+    engine = create_bench_engine(args.database_url, args.latency_ms)
+    await recreate_schema(engine)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    data = UserUpdate(description="updated")
+
+    legacy_ids = await seed(session_factory, "legacy", args.rows)
+    returning_ids = await seed(session_factory, "returning", args.rows)
+
+    results = {
+        "update (select+commit+refresh)": await measure(
+            session_factory, legacy_ids, lambda s, i: legacy_update(s, i, data)
+        ),
+        "update (UPDATE ... RETURNING)": await measure(
+            session_factory,
+            returning_ids,
+            lambda s, i: UserRepository(s).update(i, data),
+        ),
+        "delete (select+delete)": await measure(
+            session_factory, legacy_ids, legacy_delete
+        ),
+        "delete (DELETE ... RETURNING)": await measure(
+            session_factory, returning_ids, lambda s, i: UserRepository(s).delete(i)
+        ),
+    }
+    await engine.dispose()
+
+    print_table({name: summarize(samples) for name, samples in results.items()})
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Compare write latency of the legacy ORM path and RETURNING"
+    )
+    parser.add_argument("--database-url", default=DEFAULT_DATABASE_URL)
+    parser.add_argument("--rows", type=int, default=500)
+    parser.add_argument(
+        "--latency-ms",
+        type=float,
+        default=0,
+        help="simulated network round trip added to every statement",
+    )
+    asyncio.run(main(parser.parse_args()))
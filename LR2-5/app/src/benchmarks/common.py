@@ -0,0 +1,45 @@
+import statistics
+import time
+
+from entities import Base
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+DEFAULT_DATABASE_URL = "sqlite+aiosqlite:///./bench.db"
+
+
+def create_bench_engine(database_url: str, latency_ms: float = 0) -> AsyncEngine:
+    engine = create_async_engine(database_url)
+    if latency_ms > 0:
+
+        @event.listens_for(engine.sync_engine, "before_cursor_execute")
+        def simulate_round_trip(*args):
+            time.sleep(latency_ms / 1000)
+
+    return engine
+
+
+async def recreate_schema(engine: AsyncEngine) -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+
+def summarize(samples: list[float]) -> dict[str, float]:
+    ordered = sorted(samples)
+    return {
+        "count": len(ordered),
+        "mean_ms": statistics.fmean(ordered) * 1000,
+        "p50_ms": ordered[len(ordered) // 2] * 1000,
+        "p95_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000,
+        "p99_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] * 1000,
+    }
+
+
+def print_table(rows: dict[str, dict[str, float]]) -> None:
+    print(f"{'case':<32}{'mean ms':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for name, stats in rows.items():
+        print(
+            f"{name:<32}{stats['mean_ms']:>10.3f}{stats['p50_ms']:>10.3f}"
+            f"{stats['p95_ms']:>10.3f}{stats['p99_ms']:>10.3f}"
+        )
@@ -0,0 +1,36 @@
+import csv
+import io
+from typing import AsyncIterator, Sequence
+
+import msgspec
+from dto.trusted import TrustedModel, encode_trusted_lines
+from sqlalchemy import RowMapping
+
+
+async def ndjson_chunks(
+    batches: AsyncIterator[Sequence[RowMapping]],
+    model: type[TrustedModel],
+    fields: tuple[str, ...] | None = None,
+) -> AsyncIterator[bytes]:
+    async for batch in batches:
+        yield encode_trusted_lines(model.to_structs(batch, fields))
+
+
+async def csv_chunks(
+    batches: AsyncIterator[Sequence[RowMapping]],
+    model: type[TrustedModel],
+    fields: tuple[str, ...] | None = None,
+) -> AsyncIterator[bytes]:
+    fieldnames = list(fields or model.model_fields)
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fieldnames)
+    writer.writeheader()
+    async for batch in batches:
+        writer.writerows(
+            msgspec.to_builtins(struct) for struct in model.to_structs(batch, fields)
+        )
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode()
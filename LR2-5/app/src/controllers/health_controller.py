@@ -0,0 +1,18 @@
+from typing import Dict
+
+from db.pool import pool_stats
+from dto.health_dto import PoolStatsResponse
+from litestar import Controller, get
+from litestar.datastructures import State
+
+
+class HealthController(Controller):
+    path = "/health"
+
+    @get("/pool")
+    async def get_pool_stats(self, state: State) -> Dict[str, PoolStatsResponse]:
+        return {
+            name: PoolStatsResponse(**stats)
+            for name, engine in state.engines.items()
+            if (stats := pool_stats(engine)) is not None
+        }
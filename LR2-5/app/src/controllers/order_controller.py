@@ -0,0 +1,54 @@
+from uuid import UUID
+
+from dto.order_dto import OrderCreate, OrderListResponse, OrderResponse
+from litestar import Controller, delete, get, post
+from litestar.exceptions import NotFoundException, ValidationException
+from litestar.params import Parameter
+from services.order_service import OrderService
+
+
+class OrderController(Controller):
+    path = "/orders"
+
+    @get("/{order_id:uuid}", opt={"query_budget": 1})
+    async def get_order_by_id(
+        self,
+        order_service: OrderService,
+        order_id: UUID,
+    ) -> OrderResponse:
+        order = await order_service.get_detailed(order_id)
+        if not order:
+            raise NotFoundException(detail=f"Заказ с Id {order_id} не найден")
+        return OrderResponse.model_validate(order)
+
+    @get(opt={"query_budget": 2})
+    async def get_all_orders(
+        self,
+        order_service: OrderService,
+        count: int = Parameter(default=10, gt=0, le=100),
+        page: int = Parameter(default=0, ge=0),
+    ) -> OrderListResponse:
+        orders = await order_service.get_all_detailed(count, page)
+        return OrderListResponse(
+            orders=[OrderResponse.model_validate(order) for order in orders]
+        )
+
+    @post()
+    async def create_order(
+        self,
+        order_service: OrderService,
+        data: OrderCreate,
+    ) -> OrderResponse:
+        try:
+            order = await order_service.create(data)
+        except ValueError as e:
+            raise ValidationException(detail=f"Заказ не оформлен: {e}") from e
+        return OrderResponse.model_validate(await order_service.get_detailed(order.id))
+
+    @delete("/{order_id:uuid}")
+    async def delete_order(
+        self,
+        order_service: OrderService,
+        order_id: UUID,
+    ) -> None:
+        await order_service.delete(order_id)
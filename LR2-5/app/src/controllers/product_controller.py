@@ -0,0 +1,63 @@
+from typing import List
+from uuid import UUID
+
+from dto.produc_dto import ProductCreate, ProductResponse, ProductUpdate
+from litestar import Controller, delete, get, post, put
+from litestar.exceptions import NotFoundException
+from litestar.params import Parameter
+from services.product_service import ProductService
+
+
+class ProductController(Controller):
+    path = "/products"
+
+    @get("/{product_id:uuid}", opt={"query_budget": 1})
+    async def get_product_by_id(
+        self,
+        product_service: ProductService,
+        product_id: UUID,
+    ) -> ProductResponse:
+        product = await product_service.get_by_id(product_id)
+        if not product:
+            raise NotFoundException(detail=f"Товар с Id {product_id} не найден")
+        return ProductResponse.model_validate(product)
+
+    @get(opt={"query_budget": 1})
+    async def get_all_products(
+        self,
+        product_service: ProductService,
+        count: int = Parameter(default=10, gt=0),
+        page: int = Parameter(default=0, ge=0),
+    ) -> List[ProductResponse]:
+        products = await product_service.get_all(count, page)
+        return [ProductResponse.model_validate(product) for product in products]
+
+    @post()
+    async def create_product(
+        self,
+        product_service: ProductService,
+        data: ProductCreate,
+    ) -> ProductResponse:
+        product = await product_service.create(data)
+        return ProductResponse.model_validate(product)
+
+    @put("/{product_id:uuid}")
+    async def update_product(
+        self,
+        product_service: ProductService,
+        product_id: UUID,
+        data: ProductUpdate,
+    ) -> ProductResponse:
+        try:
+            product = await product_service.update(product_id, data)
+        except ValueError as e:
+            raise NotFoundException(detail=f"Товар с Id {product_id} не найден") from e
+        return ProductResponse.model_validate(product)
+
+    @delete("/{product_id:uuid}")
+    async def delete_product(
+        self,
+        product_service: ProductService,
+        product_id: UUID,
+    ) -> None:
+        await product_service.delete(product_id)
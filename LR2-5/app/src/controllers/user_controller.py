@@ -1,36 +1,265 @@
+from datetime import datetime
+from typing import Any, List, Optional
 from uuid import UUID
 
-from dto.user_dto import UserCreate, UserListResponse, UserResponse, UserUpdate
-from litestar import Controller, delete, get, post, put
-from litestar.exceptions import NotFoundException
+from controllers.conditional import (
+    body_etag,
+    is_not_modified,
+    make_etag,
+    not_modified,
+    validator_headers,
+)
+from controllers.export import csv_chunks, ndjson_chunks
+from controllers.user_list import (
+    UserListQuery,
+    parse_fields,
+    provide_user_filters,
+    provide_user_list_query,
+)
+from db.routing import SessionScope
+from dto.order_dto import OrderListResponse, OrderResponse
+from dto.trusted import encode_struct, encode_trusted
+from dto.user_dto import (
+    ExportFormat,
+    UserBatchGetRequest,
+    UserBatchGetResponse,
+    UserBulkResponse,
+    UserBulkResult,
+    UserCreate,
+    UserListResponse,
+    UserOrderStatsResponse,
+    UserResponse,
+    UserUpdate,
+)
+from litestar import Controller, MediaType, Response, delete, get, post, put
+from litestar.di import Provide
+from litestar.exceptions import NotFoundException, ValidationException
 from litestar.params import Parameter
+from litestar.response import Stream
+from repositories.pagination import encode_cursor
+from repositories.read_mode import ReadMode
+from repositories.user_sort import UserSort
+from services.order_service import OrderService
 from services.user_service import UserService
 
+MAX_BULK_SIZE = 10_000
+
 
 class UserController(Controller):
     path = "/users"
 
-    @get("/{user_id:uuid}")
+    @get("/{user_id:uuid}", opt={"query_budget": 2})
     async def get_user_by_id(
         self,
         user_service: UserService,
         user_id: UUID,
-    ) -> UserResponse:
+        fields: Optional[str] = Parameter(default=None),
+        if_none_match: Optional[str] = Parameter(header="If-None-Match", default=None),
+        if_modified_since: Optional[str] = Parameter(
+            header="If-Modified-Since", default=None
+        ),
+    ) -> Response[UserResponse]:
+        selected = parse_fields(fields)
+        if if_none_match is not None or if_modified_since is not None:
+            updated_at = await user_service.get_version(user_id)
+            etag = make_etag(user_id, updated_at, selected)
+            if updated_at is not None and is_not_modified(
+                etag, updated_at, if_none_match, if_modified_since
+            ):
+                return not_modified(etag, updated_at)
+
+        if selected is not None:
+            row = await user_service.get_columns_by_id(user_id, selected)
+            if row is None:
+                raise NotFoundException(detail=f"Пользователь с Id {user_id} не найден")
+            return Response(
+                encode_struct(UserResponse.to_structs([row], selected)[0]),
+                media_type=MediaType.JSON,
+                headers=validator_headers(
+                    make_etag(user_id, row.updated_at, selected), row.updated_at
+                ),
+            )
+
         user = await user_service.get_by_id(user_id)
         if not user:
             raise NotFoundException(detail=f"Пользователь с Id {user_id} не найден")
-        return UserResponse.model_validate(user)
+        response = UserResponse.model_validate(user)
+        return Response(
+            response,
+            headers=validator_headers(
+                make_etag(user_id, response.updated_at, selected), response.updated_at
+            ),
+        )
 
-    @get()
+    @get(
+        opt={"query_budget": 3},
+        dependencies={
+            "list_query": Provide(provide_user_list_query),
+            "user_filters": Provide(provide_user_filters),
+        },
+    )
     async def get_all_users(
         self,
         user_service: UserService,
+        list_query: UserListQuery,
+        user_filters: dict[str, Any],
+        if_none_match: Optional[str] = Parameter(header="If-None-Match", default=None),
+    ) -> Response[UserListResponse]:
+        # Deleting a user does not move max(updated_at), so lists are validated
+        # by ETag only. Order statistics change without touching updated_at,
+        # so lists sorted by them hash the body instead of the version.
+        etag = None
+        if list_query.sort == UserSort.CREATED_AT:
+            last_modified, matching = await user_service.get_list_version(
+                **user_filters
+            )
+            etag = make_etag(
+                last_modified,
+                matching,
+                list_query.count,
+                list_query.page,
+                list_query.cursor,
+                list_query.count_strategy.value,
+                sorted(user_filters.items()),
+                list_query.selected,
+                list_query.descending,
+            )
+            if is_not_modified(etag, None, if_none_match, None):
+                return not_modified(etag, None)
+
+        if list_query.cursor is not None:
+            try:
+                users, next_cursor = await user_service.get_by_cursor(
+                    count=list_query.count,
+                    cursor=list_query.cursor,
+                    columns=list_query.selected,
+                    read_mode=ReadMode.CORE,
+                    **user_filters,
+                )
+            except ValueError as e:
+                raise ValidationException(detail="Некорректный курсор") from e
+            return Response(
+                encode_trusted(
+                    UserListResponse,
+                    users=UserResponse.to_structs(users, list_query.selected),
+                    next_cursor=next_cursor,
+                ),
+                media_type=MediaType.JSON,
+                headers={"ETag": etag},
+            )
+
+        users, total, total_strategy = await user_service.get_by_filter(
+            count=list_query.count,
+            page=list_query.page,
+            count_strategy=list_query.count_strategy,
+            columns=list_query.selected,
+            read_mode=ReadMode.CORE,
+            sort=list_query.sort,
+            descending=list_query.descending,
+            **user_filters,
+        )
+        next_cursor = None
+        if (
+            list_query.sort == UserSort.CREATED_AT
+            and not list_query.descending
+            and len(users) == list_query.count
+            and (total is None or list_query.count * (list_query.page + 1) < total)
+        ):
+            next_cursor = encode_cursor(users[-1].created_at, users[-1].id)
+        body = encode_trusted(
+            UserListResponse,
+            users=UserResponse.to_structs(users, list_query.selected),
+            total=total,
+            total_strategy=total_strategy,
+            next_cursor=next_cursor,
+        )
+        if etag is None:
+            etag = body_etag(body)
+            if is_not_modified(etag, None, if_none_match, None):
+                return not_modified(etag, None)
+        return Response(body, media_type=MediaType.JSON, headers={"ETag": etag})
+
+    @get("/search", opt={"query_budget": 1})
+    async def search_users(
+        self,
+        user_service: UserService,
+        q: str = Parameter(min_length=1),
         count: int = Parameter(default=10, gt=0),
-        page: int = Parameter(default=0, ge=0),
-    ) -> UserListResponse:
-        users, total = await user_service.get_by_filter(count=count, page=page)
-        return UserListResponse(
-            users=[UserResponse.model_validate(user) for user in users], total=total
+        cursor: Optional[str] = Parameter(default=None),
+    ) -> Response[UserListResponse]:
+        try:
+            users, next_cursor = await user_service.search(
+                q, count, cursor, ReadMode.CORE
+            )
+        except ValueError as e:
+            raise ValidationException(detail="Некорректный курсор") from e
+        return Response(
+            encode_trusted(
+                UserListResponse,
+                users=UserResponse.to_structs(users),
+                next_cursor=next_cursor,
+            ),
+            media_type=MediaType.JSON,
+        )
+
+    @get("/export", opt={"query_budget": 1, "streamed": True})
+    async def export_users(
+        self,
+        user_service: UserService,
+        stream_session: SessionScope,
+        export_format: ExportFormat = Parameter(
+            query="format", default=ExportFormat.NDJSON
+        ),
+        fields: Optional[str] = Parameter(default=None),
+    ) -> Stream:
+        selected = parse_fields(fields)
+        batches = user_service.stream(columns=selected, session_scope=stream_session)
+        if export_format == ExportFormat.CSV:
+            return Stream(
+                csv_chunks(batches, UserResponse, selected),
+                media_type="text/csv",
+                headers={"Content-Disposition": 'attachment; filename="users.csv"'},
+            )
+        return Stream(
+            ndjson_chunks(batches, UserResponse, selected),
+            media_type="application/x-ndjson",
+        )
+
+    @get("/{user_id:uuid}/stats", opt={"query_budget": 2})
+    async def get_user_stats(
+        self,
+        user_service: UserService,
+        user_id: UUID,
+    ) -> UserOrderStatsResponse:
+        stats = await user_service.get_order_stats(user_id)
+        if stats is not None:
+            return UserOrderStatsResponse.model_validate(stats)
+        if await user_service.get_version(user_id) is None:
+            raise NotFoundException(detail=f"Пользователь с Id {user_id} не найден")
+        return UserOrderStatsResponse(user_id=user_id)
+
+    @get("/{user_id:uuid}/orders", opt={"query_budget": 3})
+    async def get_user_orders(
+        self,
+        user_service: UserService,
+        order_service: OrderService,
+        user_id: UUID,
+        count: int = Parameter(default=20, gt=0, le=100),
+        cursor: Optional[str] = Parameter(default=None),
+        created_after: Optional[datetime] = Parameter(default=None),
+        created_before: Optional[datetime] = Parameter(default=None),
+    ) -> OrderListResponse:
+        try:
+            orders, next_cursor = await order_service.get_page_by_user(
+                user_id, count, cursor, created_after, created_before
+            )
+        except ValueError as e:
+            raise ValidationException(detail="Некорректный курсор") from e
+        if not orders and await user_service.get_version(user_id) is None:
+            raise NotFoundException(detail=f"Пользователь с Id {user_id} не найден")
+        return OrderListResponse(
+            orders=[OrderResponse.model_validate(order) for order in orders],
+            next_cursor=next_cursor,
         )
 
     @post()
@@ -42,6 +271,52 @@ class UserController(Controller):
         user = await user_service.create(data)
         return UserResponse.model_validate(user)
 
+    @post("/bulk")
+    async def create_users_bulk(
+        self,
+        user_service: UserService,
+        data: List[UserCreate],
+    ) -> UserBulkResponse:
+        if len(data) > MAX_BULK_SIZE:
+            raise ValidationException(
+                detail=f"Можно создать не более {MAX_BULK_SIZE} пользователей за раз"
+            )
+
+        results = [
+            UserBulkResult(
+                index=index,
+                user=UserResponse.model_validate(user) if user else None,
+                conflicts=conflicts,
+            )
+            for index, (user, conflicts) in enumerate(
+                await user_service.create_many(data)
+            )
+        ]
+        created = sum(1 for result in results if result.user is not None)
+        return UserBulkResponse(
+            results=results, created=created, failed=len(results) - created
+        )
+
+    @post("/batch-get", status_code=200, opt={"query_budget": 5})
+    async def get_users_batch(
+        self,
+        user_service: UserService,
+        data: UserBatchGetRequest,
+    ) -> Response[UserBatchGetResponse]:
+        found = await user_service.get_many(data.ids, ReadMode.CORE)
+        return Response(
+            encode_trusted(
+                UserBatchGetResponse,
+                users=dict(zip(found, UserResponse.to_structs(found.values()))),
+                missing=[
+                    user_id
+                    for user_id in dict.fromkeys(data.ids)
+                    if user_id not in found
+                ],
+            ),
+            media_type=MediaType.JSON,
+        )
+
     @delete("/{user_id:uuid}")
     async def delete_user(
         self,
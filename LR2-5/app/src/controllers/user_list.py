@@ -0,0 +1,72 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, List, Optional
+from uuid import UUID
+
+from dto.user_dto import UserResponse
+from litestar.exceptions import ValidationException
+from litestar.params import Parameter
+from repositories.count_strategy import CountStrategy
+from repositories.user_sort import UserSort
+
+
+def parse_fields(fields: Optional[str]) -> tuple[str, ...] | None:
+    try:
+        return UserResponse.select_fields(fields)
+    except ValueError as e:
+        raise ValidationException(detail=f"Некорректный список полей: {fields}") from e
+
+
+@dataclass(frozen=True)
+class UserListQuery:
+    count: int
+    page: int
+    cursor: Optional[str]
+    count_strategy: CountStrategy
+    selected: tuple[str, ...] | None
+    sort: UserSort
+    descending: bool
+
+
+async def provide_user_list_query(
+    count: int = Parameter(default=10, gt=0),
+    page: int = Parameter(default=0, ge=0),
+    cursor: Optional[str] = Parameter(default=None),
+    count_strategy: CountStrategy = Parameter(default=CountStrategy.EXACT),
+    fields: Optional[str] = Parameter(default=None),
+    sort: UserSort = Parameter(default=UserSort.CREATED_AT),
+    descending: bool = Parameter(default=False),
+) -> UserListQuery:
+    if cursor is not None and (sort != UserSort.CREATED_AT or descending):
+        raise ValidationException(
+            detail="Курсор поддерживается только при сортировке по created_at"
+        )
+    return UserListQuery(
+        count, page, cursor, count_strategy, parse_fields(fields), sort, descending
+    )
+
+
+async def provide_user_filters(
+    created_after: Optional[datetime] = Parameter(default=None),
+    created_before: Optional[datetime] = Parameter(default=None),
+    updated_after: Optional[datetime] = Parameter(default=None),
+    updated_before: Optional[datetime] = Parameter(default=None),
+    username_prefix: Optional[str] = Parameter(default=None, min_length=1),
+    email: Optional[str] = Parameter(default=None),
+    ids: Optional[List[UUID]] = Parameter(query="id", default=None),
+    usernames: Optional[List[str]] = Parameter(query="username", default=None),
+) -> dict[str, Any]:
+    return {
+        key: value
+        for key, value in {
+            "created_at__gte": created_after,
+            "created_at__lt": created_before,
+            "updated_at__gte": updated_after,
+            "updated_at__lt": updated_before,
+            "username__prefix": username_prefix,
+            "email__iexact": email,
+            "id__in": ids,
+            "username__in": usernames,
+        }.items()
+        if value is not None
+    }
@@ -0,0 +1,116 @@
+import abc
+import inspect
+import logging
+import os
+import random
+import time
+from contextvars import ContextVar
+from functools import wraps
+from typing import Callable
+
+from sqlalchemy import Engine, event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+current_route: ContextVar[str | None] = ContextVar("current_route", default=None)
+current_repository_method: ContextVar[str | None] = ContextVar(
+    "current_repository_method", default=None
+)
+
+Observer = Callable[[str, str, float], None]
+
+
+def _track_method(name: str, method, observe: Observer | None):
+    @wraps(method)
+    async def tracked(self, *args, **kwargs):
+        repository = type(self).__name__
+        # Nested calls are attributed in logs but only the outermost call is
+        # observed, so its duration is not counted twice.
+        outermost = current_repository_method.get() is None
+        token = current_repository_method.set(f"{repository}.{name}")
+        started = time.perf_counter()
+        try:
+            return await method(self, *args, **kwargs)
+        finally:
+            current_repository_method.reset(token)
+            if observe is not None and outermost:
+                observe(repository, name, time.perf_counter() - started)
+
+    tracked.__tracked__ = True
+    return tracked
+
+
+def instrument_repositories(base: type, observe: Observer | None = None) -> None:
+    classes = [base]
+    while classes:
+        cls = classes.pop()
+        classes.extend(cls.__subclasses__())
+        # Resolving through the MRO also wraps methods inherited from mixins
+        # that are not repositories themselves.
+        for name in dir(cls):
+            attr = inspect.getattr_static(cls, name)
+            if (
+                not name.startswith("_")
+                and inspect.iscoroutinefunction(attr)
+                and not getattr(attr, "__tracked__", False)
+            ):
+                setattr(cls, name, _track_method(name, attr, observe))
+
+
+class StatementTimer(abc.ABC):
+    info_key = "statement_started"
+
+    def attach(self, engine: AsyncEngine | Engine) -> None:
+        sync_engine = getattr(engine, "sync_engine", engine)
+        event.listen(sync_engine, "before_cursor_execute", self._before_execute)
+        event.listen(sync_engine, "after_cursor_execute", self._after_execute)
+        event.listen(sync_engine, "handle_error", self._discard_timing)
+
+    @abc.abstractmethod
+    def record(self, elapsed: float, statement: str) -> None: ...
+
+    def _before_execute(self, conn, cursor, statement, parameters, context, many):
+        conn.info.setdefault(self.info_key, []).append(time.perf_counter())
+
+    def _after_execute(self, conn, cursor, statement, parameters, context, many):
+        self.record(time.perf_counter() - conn.info[self.info_key].pop(), statement)
+
+    def _discard_timing(self, exception_context):
+        conn = exception_context.connection
+        if conn is not None and conn.info.get(self.info_key):
+            conn.info[self.info_key].pop()
+
+
+class QueryLogger(StatementTimer):
+    info_key = "query_logger_started"
+
+    def __init__(
+        self,
+        threshold_ms: float,
+        sample_rate: float = 0.0,
+        logger: logging.Logger | None = None,
+    ):
+        self.threshold = threshold_ms / 1000
+        self.sample_rate = sample_rate
+        self.logger = logger or logging.getLogger("db.queries")
+
+    def record(self, elapsed: float, statement: str) -> None:
+        slow = elapsed >= self.threshold
+        if slow or (self.sample_rate and random.random() < self.sample_rate):
+            self.logger.log(
+                logging.WARNING if slow else logging.INFO,
+                "%s query %.2f ms route=%s repository=%s: %s",
+                "slow" if slow else "sampled",
+                elapsed * 1000,
+                current_route.get(),
+                current_repository_method.get(),
+                " ".join(statement.split()),
+            )
+
+
+def query_logger_from_env() -> QueryLogger | None:
+    threshold = os.getenv("SLOW_QUERY_MS")
+    if threshold is None:
+        return None
+    return QueryLogger(
+        float(threshold), float(os.getenv("SLOW_QUERY_SAMPLE_RATE", "0"))
+    )
@@ -0,0 +1,89 @@
+from typing import Iterator, Mapping
+
+from db.pool import pool_stats
+from prometheus_client import Histogram
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily, Metric
+from prometheus_client.registry import Collector
+from repositories.cache import EntityCache
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+repository_latency = Histogram(
+    "app_repository_duration_seconds",
+    "Repository method duration, in seconds",
+    ["repository", "method"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1),
+)
+
+
+def observe_repository_call(repository: str, method: str, elapsed: float) -> None:
+    repository_latency.labels(repository, method).observe(elapsed)
+
+
+class PoolCollector(Collector):
+    def __init__(self, engines: Mapping[str, AsyncEngine]):
+        self.engines = engines
+
+    def collect(self) -> Iterator[Metric]:
+        gauges = {
+            key: GaugeMetricFamily(f"app_db_pool_{key}", description, labels=["pool"])
+            for key, description in (
+                ("size", "Configured pool size"),
+                ("checked_out", "Connections currently checked out"),
+                ("idle", "Idle connections in the pool"),
+                ("overflow", "Overflow connections currently open"),
+            )
+        }
+        checkouts = CounterMetricFamily(
+            "app_db_pool_checkouts", "Connection checkouts", labels=["pool"]
+        )
+        waits = CounterMetricFamily(
+            "app_db_pool_waits",
+            "Checkouts that blocked on an exhausted pool",
+            labels=["pool"],
+        )
+        wait_time = CounterMetricFamily(
+            "app_db_pool_wait_seconds",
+            "Time spent waiting for a connection, in seconds",
+            labels=["pool"],
+        )
+        for name, engine in self.engines.items():
+            stats = pool_stats(engine)
+            if stats is None:
+                continue
+            for key, gauge in gauges.items():
+                gauge.add_metric([name], stats[key])
+            checkouts.add_metric([name], stats["checkouts"])
+            waits.add_metric([name], stats["waits"])
+            wait_time.add_metric([name], stats["wait_time_total_ms"] / 1000)
+        yield from gauges.values()
+        yield checkouts
+        yield waits
+        yield wait_time
+
+
+class CacheCollector(Collector):
+    def __init__(self, caches: Mapping[str, EntityCache]):
+        self.caches = caches
+
+    def collect(self) -> Iterator[Metric]:
+        gauges = {
+            key: GaugeMetricFamily(f"app_cache_{key}", description, labels=["cache"])
+            for key, description in (
+                ("size", "Entries currently cached"),
+                ("maxsize", "Configured cache capacity"),
+            )
+        }
+        counters = {
+            key: CounterMetricFamily(f"app_cache_{key}", description, labels=["cache"])
+            for key, description in (
+                ("hits", "Cache hits"),
+                ("misses", "Cache misses"),
+                ("evictions", "Entries evicted to stay within capacity"),
+            )
+        }
+        for name, cache in self.caches.items():
+            stats = cache.stats()
+            for key, metric in (gauges | counters).items():
+                metric.add_metric([name], stats[key])
+        yield from gauges.values()
+        yield from counters.values()
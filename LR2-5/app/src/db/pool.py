@@ -0,0 +1,116 @@
+import asyncio
+import os
+import threading
+import time
+from typing import Any, Sequence
+
+from sqlalchemy import Executable, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy.util.queue import AsyncAdaptedQueue
+
+
+class WaitStats:
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self.count += 1
+            self.total += seconds
+            self.max = max(self.max, seconds)
+
+
+class WaitTimedQueue(AsyncAdaptedQueue):
+    def __init__(self, maxsize: int = 0, use_lifo: bool = False):
+        super().__init__(maxsize, use_lifo)
+        self.wait_stats = WaitStats()
+
+    def get(self, block: bool = True, timeout: float | None = None) -> Any:
+        if not block:
+            return super().get(block, timeout)
+        started = time.perf_counter()
+        try:
+            return super().get(block, timeout)
+        finally:
+            self.wait_stats.record(time.perf_counter() - started)
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    _queue_class = WaitTimedQueue
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.wait_stats = self._pool.wait_stats
+
+    def connect(self):
+        self.checkouts += 1
+        return super().connect()
+
+
+def pool_options_from_env(url: str) -> dict[str, Any]:
+    options: dict[str, Any] = {
+        "pool_pre_ping": os.getenv("DB_POOL_PRE_PING", "false").lower() == "true",
+        "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", "1800")),
+    }
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "sqlite" and parsed.database in (
+        None,
+        "",
+        ":memory:",
+    ):
+        return options
+    return options | {
+        "poolclass": InstrumentedQueuePool,
+        "pool_size": int(os.getenv("DB_POOL_SIZE", "5")),
+        "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "10")),
+        "pool_timeout": float(os.getenv("DB_POOL_TIMEOUT", "30")),
+    }
+
+
+def create_engine_from_env(url: str, **kwargs: Any) -> AsyncEngine:
+    return create_async_engine(url, **(pool_options_from_env(url) | kwargs))
+
+
+def pool_stats(engine: AsyncEngine) -> dict[str, Any] | None:
+    pool = engine.pool
+    if not isinstance(pool, InstrumentedQueuePool):
+        return None
+    wait_stats = pool.wait_stats
+    return {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "idle": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+        "checkouts": pool.checkouts,
+        "waits": wait_stats.count,
+        "wait_time_total_ms": wait_stats.total * 1000,
+        "wait_time_max_ms": wait_stats.max * 1000,
+    }
+
+
+async def warm_up(
+    engine: AsyncEngine, connections: int, statements: Sequence[Executable] = ()
+) -> None:
+    if connections <= 0:
+        return
+    results = await asyncio.gather(
+        *(engine.connect().start() for _ in range(connections)),
+        return_exceptions=True,
+    )
+    opened = [conn for conn in results if not isinstance(conn, BaseException)]
+    try:
+        for error in results:
+            if isinstance(error, BaseException):
+                raise error
+        for conn in opened:
+            for statement in statements:
+                await conn.execute(statement)
+            await conn.rollback()
+    finally:
+        for conn in opened:
+            await conn.close()
@@ -0,0 +1,123 @@
+import logging
+import os
+from collections import Counter
+from contextvars import ContextVar
+
+from db.instrumentation import StatementTimer
+from litestar.datastructures import MutableScopeHeaders
+from litestar.enums import ScopeType
+from litestar.middleware import ASGIMiddleware
+from litestar.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger("db.queries")
+
+
+class QueryStats:
+    __slots__ = ("count", "duration", "shapes")
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.shapes: Counter[str] = Counter()
+
+    def repeated(self, threshold: int) -> dict[str, int]:
+        return {shape: n for shape, n in self.shapes.items() if n >= threshold}
+
+
+current_query_stats: ContextVar[QueryStats | None] = ContextVar(
+    "current_query_stats", default=None
+)
+
+
+class QueryCounter(StatementTimer):
+    info_key = "query_counter_started"
+
+    def record(self, elapsed: float, statement: str) -> None:
+        stats = current_query_stats.get()
+        if stats is not None:
+            stats.count += 1
+            stats.duration += elapsed
+            stats.shapes[statement] += 1
+
+
+class QueryStatsMiddleware(ASGIMiddleware):
+    scopes = (ScopeType.HTTP,)
+
+    def __init__(self, repeat_threshold: int = 3, strict: bool = False):
+        self.repeat_threshold = repeat_threshold
+        self.strict = strict
+
+    async def handle(
+        self, scope: Scope, receive: Receive, send: Send, next_app: ASGIApp
+    ) -> None:
+        stats = QueryStats()
+        opt = scope["route_handler"].opt
+        budget = opt.get("query_budget")
+        # A streamed body runs its queries after the response has started, so
+        # its count is only known to the log written once the body is sent.
+        streamed = opt.get("streamed", False)
+        route = f"{scope['method']} {scope.get('path_template', scope['path'])}"
+
+        rejected = False
+
+        async def send_with_stats(message: Message) -> None:
+            nonlocal rejected
+            if rejected:
+                return
+            if message["type"] == "http.response.start" and not streamed:
+                if self.strict and budget is not None and stats.count > budget:
+                    rejected = True
+                    await self._reject(send, route, budget, stats)
+                    return
+                headers = MutableScopeHeaders.from_message(message)
+                headers["X-DB-Query-Count"] = str(stats.count)
+                headers["X-DB-Time-Ms"] = f"{stats.duration * 1000:.2f}"
+            await send(message)
+
+        token = current_query_stats.set(stats)
+        try:
+            await next_app(scope, receive, send_with_stats)
+        finally:
+            current_query_stats.reset(token)
+        self._report(route, budget, stats)
+
+    async def _reject(
+        self, send: Send, route: str, budget: int, stats: QueryStats
+    ) -> None:
+        detail = f"{route} issued {stats.count} queries, budget is {budget}"
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 500,
+                "headers": [(b"content-type", b"text/plain; charset=utf-8")],
+            }
+        )
+        await send({"type": "http.response.body", "body": detail.encode()})
+
+    def _report(self, route: str, budget: int | None, stats: QueryStats) -> None:
+        logger.debug(
+            "%s issued %d queries in %.2f ms",
+            route,
+            stats.count,
+            stats.duration * 1000,
+        )
+        if budget is not None and stats.count > budget:
+            logger.warning(
+                "%s issued %d queries, budget is %d", route, stats.count, budget
+            )
+        for shape, times in stats.repeated(self.repeat_threshold).items():
+            logger.warning(
+                "possible N+1 in %s: statement ran %d times: %s",
+                route,
+                times,
+                " ".join(shape.split()),
+            )
+
+
+def query_stats_from_env() -> QueryStatsMiddleware | None:
+    if os.getenv("QUERY_STATS", "false").lower() != "true":
+        return None
+    return QueryStatsMiddleware(
+        int(os.getenv("QUERY_REPEAT_THRESHOLD", "3")),
+        os.getenv("QUERY_BUDGET_STRICT", "false").lower() == "true",
+    )
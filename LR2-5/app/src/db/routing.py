@@ -0,0 +1,110 @@
+import itertools
+import os
+import time
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from enum import Enum
+from typing import AsyncIterator, Callable, Sequence
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+SessionScope = Callable[[], AbstractAsyncContextManager[AsyncSession]]
+
+
+class ReplicaStrategy(str, Enum):
+    ROUND_ROBIN = "round_robin"
+    LEAST_BUSY = "least_busy"
+
+
+class ReadYourWritesWindow:
+    def __init__(self, seconds: float, max_clients: int = 10_000):
+        self.seconds = seconds
+        self.max_clients = max_clients
+        self._pinned_until: dict[str, float] = {}
+
+    def pin(self, client: str) -> None:
+        if self.seconds <= 0:
+            return
+        now = time.monotonic()
+        if len(self._pinned_until) >= self.max_clients:
+            self._pinned_until = {
+                key: until for key, until in self._pinned_until.items() if until > now
+            }
+        self._pinned_until[client] = now + self.seconds
+
+    def is_pinned(self, client: str) -> bool:
+        until = self._pinned_until.get(client)
+        if until is None:
+            return False
+        if until < time.monotonic():
+            self._pinned_until.pop(client, None)
+            return False
+        return True
+
+
+def _session_factory(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+
+class SessionRouter:
+    def __init__(
+        self,
+        primary: AsyncEngine,
+        replicas: Sequence[AsyncEngine] = (),
+        strategy: ReplicaStrategy = ReplicaStrategy.ROUND_ROBIN,
+        window: ReadYourWritesWindow | None = None,
+    ):
+        self.primary = _session_factory(primary)
+        self.replicas = [_session_factory(replica) for replica in replicas]
+        self.strategy = strategy
+        self.window = window or ReadYourWritesWindow(0)
+        self.in_flight = [0] * len(self.replicas)
+        self._next = itertools.cycle(range(len(self.replicas)))
+
+    @asynccontextmanager
+    async def session(
+        self, read_only: bool, client: str | None = None
+    ) -> AsyncIterator[AsyncSession]:
+        if not read_only and client is not None:
+            self.window.pin(client)
+        if (
+            not read_only
+            or not self.replicas
+            or (client is not None and self.window.is_pinned(client))
+        ):
+            async with self.primary() as session:
+                yield session
+            return
+
+        index = self._pick_replica()
+        self.in_flight[index] += 1
+        try:
+            async with self.replicas[index]() as session:
+                yield session
+        finally:
+            self.in_flight[index] -= 1
+
+    def _pick_replica(self) -> int:
+        if self.strategy == ReplicaStrategy.LEAST_BUSY:
+            return min(range(len(self.replicas)), key=self.in_flight.__getitem__)
+        return next(self._next)
+
+
+def replica_urls_from_env() -> list[str]:
+    return [
+        url.strip()
+        for url in os.getenv("DATABASE_REPLICA_URLS", "").split(",")
+        if url.strip()
+    ]
+
+
+def router_from_env(
+    primary: AsyncEngine, replicas: Sequence[AsyncEngine]
+) -> SessionRouter:
+    return SessionRouter(
+        primary,
+        replicas,
+        ReplicaStrategy(os.getenv("DATABASE_REPLICA_STRATEGY", "round_robin")),
+        ReadYourWritesWindow(float(os.getenv("READ_YOUR_WRITES_SECONDS", "5"))),
+    )
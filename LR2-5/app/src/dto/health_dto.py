@@ -0,0 +1,12 @@
+from pydantic import BaseModel
+
+
+class PoolStatsResponse(BaseModel):
+    size: int
+    checked_out: int
+    idle: int
+    overflow: int
+    checkouts: int
+    waits: int
+    wait_time_total_ms: float
+    wait_time_max_ms: float
@@ -1,10 +1,43 @@
 import uuid
-from typing import List
+from datetime import datetime
+from typing import List, Optional
 
-from pydantic import BaseModel
+from dto.produc_dto import ProductResponse
+from pydantic import UUID4, BaseModel, Field
 
 
 class OrderCreate(BaseModel):
     user_id: uuid.UUID
     address_id: uuid.UUID
-    product_ids: List[uuid.UUID]
+    product_ids: List[uuid.UUID] = Field(min_length=1)
+
+
+class AddressResponse(BaseModel):
+    id: UUID4
+    street: str
+    city: str
+    state: Optional[str]
+    zip_code: Optional[int]
+    country: str
+    is_primary: bool
+
+    class Config:
+        from_attributes = True
+
+
+class OrderResponse(BaseModel):
+    id: UUID4
+    user_id: UUID4
+    address: AddressResponse
+    products: List[ProductResponse]
+    total: Optional[float] = None
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class OrderListResponse(BaseModel):
+    orders: List[OrderResponse]
+    next_cursor: Optional[str] = None
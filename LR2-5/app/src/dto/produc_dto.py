@@ -1,5 +1,6 @@
 from typing import Optional
 
+from dto.trusted import TrustedModel
 from pydantic import UUID4, BaseModel
 
 
@@ -15,7 +16,7 @@ class ProductUpdate(BaseModel):
     count: Optional[int] = None
 
 
-class ProductResponse(BaseModel):
+class ProductResponse(TrustedModel):
     id: UUID4
     name: str
     price: float
@@ -0,0 +1,76 @@
+from collections.abc import Iterable, Mapping
+from functools import cache
+from operator import attrgetter, itemgetter
+from typing import Any
+
+import msgspec
+from pydantic import BaseModel
+from pydantic.fields import FieldInfo
+
+_encoder = msgspec.json.Encoder()
+
+
+class TrustedModel(BaseModel):
+    @classmethod
+    def select_fields(cls, raw: str | None) -> tuple[str, ...] | None:
+        if raw is None:
+            return None
+        names = tuple(dict.fromkeys(name.strip() for name in raw.split(",")))
+        unknown = [name for name in names if name not in cls._fields()]
+        if unknown or not names:
+            raise ValueError(f"Unknown fields {unknown!r} for {cls.__name__}")
+        return names
+
+    @classmethod
+    def _fields(cls) -> dict[str, FieldInfo]:
+        # pylint infers model_fields as the deprecated instance property.
+        return dict(cls.model_fields)
+
+    @classmethod
+    @cache
+    def _struct(cls, fields: tuple[str, ...] | None = None) -> type[msgspec.Struct]:
+        model_fields = cls._fields()
+        names = model_fields if fields is None else fields
+        return msgspec.defstruct(
+            f"Trusted{cls.__name__}",
+            [(name, model_fields[name].annotation) for name in names],
+        )
+
+    @classmethod
+    def to_structs(
+        cls, objs: Iterable[Any], fields: tuple[str, ...] | None = None
+    ) -> list[msgspec.Struct]:
+        struct = cls._struct(fields)
+        names = struct.__struct_fields__
+        if len(names) == 1:
+            return [
+                struct(
+                    obj[names[0]]
+                    if isinstance(obj, Mapping)
+                    else getattr(obj, names[0])
+                )
+                for obj in objs
+            ]
+        get_attrs = attrgetter(*names)
+        get_items = itemgetter(*names)
+        return [
+            struct(*(get_items(obj) if isinstance(obj, Mapping) else get_attrs(obj)))
+            for obj in objs
+        ]
+
+
+def encode_trusted(model: type[BaseModel], **values: Any) -> bytes:
+    return _encoder.encode(
+        {
+            name: values.get(name, field.default)
+            for name, field in model.model_fields.items()
+        }
+    )
+
+
+def encode_struct(struct: msgspec.Struct) -> bytes:
+    return _encoder.encode(struct)
+
+
+def encode_trusted_lines(structs: list[msgspec.Struct]) -> bytes:
+    return _encoder.encode_lines(structs)
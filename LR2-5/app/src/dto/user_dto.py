@@ -1,7 +1,9 @@
 from datetime import datetime
-from typing import List, Optional
+from enum import Enum
+from typing import Dict, List, Optional
 
-from pydantic import UUID4, BaseModel
+from dto.trusted import TrustedModel
+from pydantic import UUID4, BaseModel, Field
 
 
 class UserCreate(BaseModel):
@@ -16,7 +18,7 @@ class UserUpdate(BaseModel):
     description: Optional[str] = None
 
 
-class UserResponse(BaseModel):
+class UserResponse(TrustedModel):
     id: UUID4
     username: str
     email: str
@@ -28,6 +30,44 @@ class UserResponse(BaseModel):
         from_attributes = True
 
 
+class UserOrderStatsResponse(BaseModel):
+    user_id: UUID4
+    order_count: int = 0
+    total_spent: float = 0
+    last_order_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
 class UserListResponse(BaseModel):
     users: List[UserResponse]
-    total: int
+    total: Optional[int] = None
+    total_strategy: Optional[str] = None
+    next_cursor: Optional[str] = None
+
+
+class UserBatchGetRequest(BaseModel):
+    ids: List[UUID4] = Field(min_length=1, max_length=5000)
+
+
+class UserBatchGetResponse(BaseModel):
+    users: Dict[UUID4, UserResponse]
+    missing: List[UUID4]
+
+
+class UserBulkResult(BaseModel):
+    index: int
+    user: Optional[UserResponse] = None
+    conflicts: List[str] = []
+
+
+class UserBulkResponse(BaseModel):
+    results: List[UserBulkResult]
+    created: int
+    failed: int
+
+
+class ExportFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Column, ForeignKey, Uuid
+from sqlalchemy import DDL, Column, ForeignKey, Index, Uuid, event, func, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import Mapped, relationship
 from sqlalchemy.testing.schema import Table, mapped_column
@@ -32,6 +32,48 @@ class User(Base):
     addresses = relationship("Address", back_populates="user")
     orders = relationship("Order", back_populates="user")
 
+    __table_args__ = (
+        Index("ix_users_created_at_id", "created_at", "id"),
+        Index("ix_users_updated_at", "updated_at"),
+        Index("ix_users_lower_email", func.lower(text("email"))),
+        Index(
+            "ix_users_lower_username_pattern",
+            func.lower(text("username")).label("username_lower"),
+            postgresql_ops={"username_lower": "text_pattern_ops"},
+        ),
+    )
+
+
+for statement in (
+    "ALTER TABLE users ADD COLUMN search_vector tsvector GENERATED ALWAYS AS "
+    "(to_tsvector('english', coalesce(description, ''))) STORED",
+    "CREATE INDEX ix_users_search_vector ON users USING gin (search_vector)",
+):
+    event.listen(
+        User.__table__, "after_create", DDL(statement).execute_if(dialect="postgresql")
+    )
+for statement in (
+    "CREATE VIRTUAL TABLE users_fts USING fts5("
+    "user_id UNINDEXED, description, tokenize='porter unicode61')",
+    "CREATE TRIGGER users_fts_insert AFTER INSERT ON users BEGIN "
+    "INSERT INTO users_fts (user_id, description) VALUES (new.id, new.description); "
+    "END",
+    "CREATE TRIGGER users_fts_update AFTER UPDATE OF description ON users BEGIN "
+    "UPDATE users_fts SET description = new.description WHERE user_id = new.id; "
+    "END",
+    "CREATE TRIGGER users_fts_delete AFTER DELETE ON users BEGIN "
+    "DELETE FROM users_fts WHERE user_id = old.id; "
+    "END",
+):
+    event.listen(
+        User.__table__, "after_create", DDL(statement).execute_if(dialect="sqlite")
+    )
+event.listen(
+    User.__table__,
+    "before_drop",
+    DDL("DROP TABLE IF EXISTS users_fts").execute_if(dialect="sqlite"),
+)
+
 
 class Address(Base):
     __tablename__ = "addresses"
@@ -90,6 +132,7 @@ class Order(Base):
     product_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("products.id"), nullable=False
     )
+    total: Mapped[float] = mapped_column(nullable=True)
 
     created_at: Mapped[datetime] = mapped_column(default=datetime.now)
     updated_at: Mapped[datetime] = mapped_column(
@@ -99,3 +142,28 @@ class Order(Base):
     user = relationship("User", back_populates="orders")
     address = relationship("Address", back_populates="orders")
     products = relationship("Product", secondary=order_product, back_populates="orders")
+
+    __table_args__ = (
+        Index("ix_orders_user_id_created_at_id", "user_id", "created_at", "id"),
+    )
+
+
+class UserOrderStats(Base):
+    __tablename__ = "user_order_stats"
+
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    order_count: Mapped[int] = mapped_column(nullable=False, default=0)
+    total_spent: Mapped[float] = mapped_column(nullable=False, default=0)
+    last_order_at: Mapped[datetime] = mapped_column(nullable=True)
+
+    updated_at: Mapped[datetime] = mapped_column(
+        default=datetime.now, onupdate=datetime.now
+    )
+
+    __table_args__ = (
+        Index("ix_user_order_stats_order_count", "order_count"),
+        Index("ix_user_order_stats_total_spent", "total_spent"),
+        Index("ix_user_order_stats_last_order_at", "last_order_at"),
+    )
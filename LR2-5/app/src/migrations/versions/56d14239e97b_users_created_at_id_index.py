@@ -0,0 +1,30 @@
+"""users created_at id index
+
+Revision ID: 56d14239e97b
+Revises: aba2d39f43cc
+Create Date: 2026-10-18 12:20:11.402117
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "56d14239e97b"
+down_revision: Union[str, Sequence[str], None] = "aba2d39f43cc"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_users_created_at_id", "users", ["created_at", "id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_users_created_at_id", table_name="users")
@@ -0,0 +1,35 @@
+"""user order stats for every user
+
+Revision ID: a4d9e2b7c613
+Revises: f1a6b3c9d270
+Create Date: 2026-10-18 19:42:07.551203
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a4d9e2b7c613"
+down_revision: Union[str, Sequence[str], None] = "f1a6b3c9d270"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("""
+        INSERT INTO user_order_stats
+            (user_id, order_count, total_spent, last_order_at, updated_at)
+        SELECT users.id, 0, 0, NULL, CURRENT_TIMESTAMP
+        FROM users
+        WHERE NOT EXISTS (
+            SELECT 1 FROM user_order_stats WHERE user_order_stats.user_id = users.id
+        )
+        """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DELETE FROM user_order_stats WHERE order_count = 0")
@@ -0,0 +1,39 @@
+"""users filter indexes
+
+Revision ID: b7e4a91c3d25
+Revises: 56d14239e97b
+Create Date: 2026-10-18 12:41:37.905512
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b7e4a91c3d25"
+down_revision: Union[str, Sequence[str], None] = "56d14239e97b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index("ix_users_updated_at", "users", ["updated_at"], unique=False)
+    op.create_index(
+        "ix_users_lower_email", "users", [sa.text("lower(email)")], unique=False
+    )
+    op.create_index(
+        "ix_users_lower_username_pattern",
+        "users",
+        [sa.text("lower(username) text_pattern_ops")],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_users_lower_username_pattern", table_name="users")
+    op.drop_index("ix_users_lower_email", table_name="users")
+    op.drop_index("ix_users_updated_at", table_name="users")
@@ -0,0 +1,32 @@
+"""orders user created_at index
+
+Revision ID: c5d2f7a81b39
+Revises: e3f0c8d2a614
+Create Date: 2026-10-18 15:20:11.402816
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c5d2f7a81b39"
+down_revision: Union[str, Sequence[str], None] = "e3f0c8d2a614"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_orders_user_id_created_at_id",
+        "orders",
+        ["user_id", "created_at", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_orders_user_id_created_at_id", table_name="orders")
@@ -0,0 +1,39 @@
+"""users description search
+
+Revision ID: e3f0c8d2a614
+Revises: b7e4a91c3d25
+Create Date: 2026-10-18 13:02:54.118730
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e3f0c8d2a614"
+down_revision: Union[str, Sequence[str], None] = "b7e4a91c3d25"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(
+        "ALTER TABLE users ADD COLUMN search_vector tsvector GENERATED ALWAYS AS "
+        "(to_tsvector('english', coalesce(description, ''))) STORED"
+    )
+    op.create_index(
+        "ix_users_search_vector",
+        "users",
+        ["search_vector"],
+        unique=False,
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_users_search_vector", table_name="users")
+    op.drop_column("users", "search_vector")
@@ -0,0 +1,60 @@
+"""user order stats
+
+Revision ID: f1a6b3c9d270
+Revises: c5d2f7a81b39
+Create Date: 2026-10-18 16:05:42.318904
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f1a6b3c9d270"
+down_revision: Union[str, Sequence[str], None] = "c5d2f7a81b39"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("orders", sa.Column("total", sa.Float(), nullable=True))
+    op.create_table(
+        "user_order_stats",
+        sa.Column("user_id", sa.Uuid(), nullable=False),
+        sa.Column("order_count", sa.Integer(), nullable=False),
+        sa.Column("total_spent", sa.Float(), nullable=False),
+        sa.Column("last_order_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id"),
+    )
+    op.create_index(
+        "ix_user_order_stats_order_count",
+        "user_order_stats",
+        ["order_count"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_user_order_stats_total_spent",
+        "user_order_stats",
+        ["total_spent"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_user_order_stats_last_order_at",
+        "user_order_stats",
+        ["last_order_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_user_order_stats_last_order_at", table_name="user_order_stats")
+    op.drop_index("ix_user_order_stats_total_spent", table_name="user_order_stats")
+    op.drop_index("ix_user_order_stats_order_count", table_name="user_order_stats")
+    op.drop_table("user_order_stats")
+    op.drop_column("orders", "total")
@@ -0,0 +1,101 @@
+from datetime import datetime
+from typing import Any, Sequence
+from uuid import UUID
+
+from repositories.dialect import uuid_in
+from repositories.read_mode import ReadMode
+from sqlalchemy import Row, Select, delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+KEY_COLUMNS = ("id", "created_at", "updated_at")
+
+
+class BaseRepository:
+    model: Any
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_by_id(
+        self, entity_id: UUID, read_mode: ReadMode = ReadMode.ORM
+    ) -> Any | None:
+        columns = self._read_columns(None, read_mode)
+        if columns is not None:
+            return await self.get_columns_by_id(entity_id, columns)
+        stmt = select(self.model).where(self.model.id == entity_id)
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def get_columns_by_id(
+        self, entity_id: UUID, columns: Sequence[str]
+    ) -> Row | None:
+        stmt = self._projection(columns).where(self.model.id == entity_id)
+        return (await self.session.execute(stmt)).one_or_none()
+
+    async def get_version(self, entity_id: UUID) -> datetime | None:
+        stmt = select(self.model.updated_at).where(self.model.id == entity_id)
+        return (await self.session.execute(stmt)).scalar_one_or_none()
+
+    async def get_many(
+        self,
+        entity_ids: Sequence[UUID],
+        chunk_size: int = 1000,
+        read_mode: ReadMode = ReadMode.ORM,
+    ) -> dict[UUID, Any]:
+        columns = self._read_columns(None, read_mode)
+        found = {}
+        unique_ids = list(dict.fromkeys(entity_ids))
+        for start in range(0, len(unique_ids), chunk_size):
+            chunk = unique_ids[start : start + chunk_size]
+            stmt = self._projection(columns).where(
+                uuid_in(self.session.bind.dialect.name, self.model.id, chunk)
+            )
+            for entity in await self._fetch(stmt, columns):
+                found[entity.id] = entity
+        return found
+
+    def _read_columns(
+        self, columns: Sequence[str] | None, read_mode: ReadMode
+    ) -> Sequence[str] | None:
+        if columns is None and read_mode == ReadMode.CORE:
+            return tuple(self.model.__table__.c.keys())
+        return columns
+
+    def _projection(self, columns: Sequence[str] | None) -> Select:
+        if columns is None:
+            return select(self.model)
+        table = self.model.__table__
+        return select(
+            *(table.c[name] for name in dict.fromkeys((*KEY_COLUMNS, *columns)))
+        )
+
+    async def _fetch(self, stmt: Select, columns: Sequence[str] | None = None) -> list:
+        result = await self.session.execute(stmt)
+        if columns is None:
+            return list(result.scalars().all())
+        return list(result.all())
+
+    async def _update_by_id(self, entity_id: UUID, values: dict) -> Any | None:
+        if not values:
+            return await self.get_by_id(entity_id)
+
+        stmt = (
+            update(self.model)
+            .where(self.model.id == entity_id)
+            .values(**values)
+            .returning(self.model)
+            .execution_options(populate_existing=True)
+        )
+        entity = (await self.session.execute(stmt)).scalar_one_or_none()
+        await self.session.commit()
+        return entity
+
+    async def _delete_by_id(self, entity_id: UUID) -> bool:
+        stmt = (
+            delete(self.model)
+            .where(self.model.id == entity_id)
+            .returning(self.model.id)
+        )
+        deleted = (await self.session.execute(stmt)).scalar_one_or_none()
+        await self.session.commit()
+        return deleted is not None
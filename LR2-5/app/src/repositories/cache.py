@@ -0,0 +1,143 @@
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Sequence
+from uuid import UUID
+
+from dto.order_dto import OrderCreate
+from dto.produc_dto import ProductResponse
+from dto.user_dto import UserResponse
+from entities import Order
+from pydantic import BaseModel
+from repositories.order_repository import OrderRepository
+from repositories.product_repository import ProductRepository
+from repositories.read_mode import ReadMode
+from repositories.user_repository import UserRepository
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class EntityCache:
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[Hashable, tuple[bytes, float]] = OrderedDict()
+
+    def get(self, key: Hashable) -> bytes | None:
+        entry = self._entries.get(key)
+        if entry is None or entry[1] < time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def set(self, key: Hashable, payload: bytes) -> None:
+        self._entries[key] = (payload, time.monotonic() + self.ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+def cache_from_env(prefix: str) -> EntityCache | None:
+    maxsize = int(os.getenv(f"{prefix}_CACHE_SIZE", "0"))
+    if maxsize <= 0:
+        return None
+    return EntityCache(maxsize, float(os.getenv(f"{prefix}_CACHE_TTL", "60")))
+
+
+class CachedRepositoryMixin:
+    response_model: type[BaseModel]
+
+    def __init__(self, session: AsyncSession, cache: EntityCache):
+        super().__init__(session)
+        self.cache = cache
+
+    async def get_by_id(
+        self, entity_id: UUID, read_mode: ReadMode = ReadMode.ORM
+    ) -> BaseModel | None:
+        payload = self.cache.get(entity_id)
+        if payload is not None:
+            return self.response_model.model_validate_json(payload)
+
+        entity = await super().get_by_id(entity_id, read_mode)
+        if entity is None:
+            return None
+        response = self.response_model.model_validate(entity)
+        self.cache.set(entity_id, response.model_dump_json().encode())
+        return response
+
+    async def get_many(
+        self,
+        entity_ids: Sequence[UUID],
+        chunk_size: int = 1000,
+        read_mode: ReadMode = ReadMode.ORM,
+    ) -> dict[UUID, BaseModel]:
+        found = {}
+        missing = []
+        for entity_id in dict.fromkeys(entity_ids):
+            payload = self.cache.get(entity_id)
+            if payload is None:
+                missing.append(entity_id)
+            else:
+                found[entity_id] = self.response_model.model_validate_json(payload)
+
+        for entity_id, entity in (
+            await super().get_many(missing, chunk_size, read_mode)
+        ).items():
+            response = self.response_model.model_validate(entity)
+            self.cache.set(entity_id, response.model_dump_json().encode())
+            found[entity_id] = response
+        return found
+
+    async def update(self, entity_id: UUID, data: BaseModel) -> Any:
+        try:
+            return await super().update(entity_id, data)
+        finally:
+            self.cache.invalidate(entity_id)
+
+    async def delete(self, entity_id: UUID) -> None:
+        try:
+            await super().delete(entity_id)
+        finally:
+            self.cache.invalidate(entity_id)
+
+
+class CachedUserRepository(CachedRepositoryMixin, UserRepository):
+    response_model = UserResponse
+
+
+class CachedProductRepository(CachedRepositoryMixin, ProductRepository):
+    response_model = ProductResponse
+
+
+class ProductCacheOrderRepository(OrderRepository):
+    def __init__(self, session: AsyncSession, product_cache: EntityCache):
+        super().__init__(session)
+        self.product_cache = product_cache
+
+    async def create(self, order_data: OrderCreate) -> Order:
+        order = await super().create(order_data)
+        for product_id in order_data.product_ids:
+            self.product_cache.invalidate(product_id)
+        return order
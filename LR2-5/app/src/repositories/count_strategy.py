@@ -0,0 +1,35 @@
+import os
+import time
+from enum import Enum
+
+
+class CountStrategy(str, Enum):
+    EXACT = "exact"
+    ESTIMATED = "estimated"
+    CACHED = "cached"
+    NONE = "none"
+
+
+class TotalCountCache:
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._totals: dict[frozenset, tuple[int, float]] = {}
+
+    def get(self, filters: dict) -> int | None:
+        entry = self._totals.get(frozenset(filters.items()))
+        if entry is None:
+            return None
+        total, expires_at = entry
+        if expires_at < time.monotonic():
+            self._totals.pop(frozenset(filters.items()), None)
+            return None
+        return total
+
+    def set(self, filters: dict, total: int) -> None:
+        self._totals[frozenset(filters.items())] = (total, time.monotonic() + self.ttl)
+
+    def clear(self) -> None:
+        self._totals.clear()
+
+
+user_count_cache = TotalCountCache(ttl=float(os.getenv("USER_COUNT_CACHE_TTL", "30")))
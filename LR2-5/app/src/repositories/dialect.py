@@ -0,0 +1,18 @@
+from sqlalchemy import ColumnElement, Uuid, any_, bindparam
+from sqlalchemy.dialects import postgresql, sqlite
+
+
+def upsert(dialect_name: str, table):
+    if dialect_name == "postgresql":
+        return postgresql.insert(table)
+    if dialect_name == "sqlite":
+        return sqlite.insert(table)
+    raise NotImplementedError(f"Upsert is not supported for {dialect_name}")
+
+
+def uuid_in(dialect_name: str, column, values: list) -> ColumnElement:
+    if dialect_name == "postgresql":
+        return column == any_(
+            bindparam("ids", value=values, type_=postgresql.ARRAY(Uuid))
+        )
+    return column.in_(values)
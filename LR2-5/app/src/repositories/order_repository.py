@@ -1,52 +1,181 @@
+from collections import Counter
+from datetime import datetime
 from typing import List
 from uuid import UUID
 
 from dto.order_dto import OrderCreate
-from entities import Order, order_product
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from entities import Address, Order, Product, User, order_product
+from repositories.base_repository import BaseRepository
+from repositories.dialect import uuid_in
+from repositories.order_stats import forget_order, record_order
+from repositories.pagination import apply_keyset, split_page
+from repositories.read_mode import ReadMode
+from sqlalchemy import delete, select, update
+from sqlalchemy.orm import joinedload, selectinload
 
+ORDER_DETAILS = (joinedload(Order.address), joinedload(Order.products))
+ORDER_PAGE_DETAILS = (joinedload(Order.address), selectinload(Order.products))
 
-class OrderRepository:
-    def __init__(self, session: AsyncSession):
-        self.session = session
 
-    async def get_by_id(self, order_id: UUID) -> Order | None:
-        stmt = select(Order).where(Order.id == order_id)
-        result = await self.session.execute(stmt)
-        return result.scalar_one_or_none()
+class OrderRepository(BaseRepository):
+    model = Order
 
-    async def get_all(self, count: int, page: int) -> List[Order]:
-        stmt = select(Order).offset(count * page).limit(count)
-        result = await self.session.execute(stmt)
-        return list(result.scalars().all())
+    async def get_all(
+        self, count: int, page: int, read_mode: ReadMode = ReadMode.ORM
+    ) -> List[Order]:
+        columns = self._read_columns(None, read_mode)
+        stmt = self._projection(columns).offset(count * page).limit(count)
+        return await self._fetch(stmt, columns)
 
-    async def get_by_user(self, user_id: UUID) -> List[Order]:
-        stmt = select(Order).where(Order.user_id == user_id)
-        result = await self.session.execute(stmt)
-        return list(result.scalars().all())
+    async def get_by_user(
+        self, user_id: UUID, read_mode: ReadMode = ReadMode.ORM
+    ) -> List[Order]:
+        columns = self._read_columns(None, read_mode)
+        stmt = self._projection(columns).where(Order.user_id == user_id)
+        return await self._fetch(stmt, columns)
+
+    async def get_page_by_user(
+        self,
+        user_id: UUID,
+        count: int,
+        cursor: str | None = None,
+        created_after: datetime | None = None,
+        created_before: datetime | None = None,
+    ) -> tuple[List[Order], str | None]:
+        stmt = (
+            select(Order).where(Order.user_id == user_id).options(*ORDER_PAGE_DETAILS)
+        )
+        if created_after is not None:
+            stmt = stmt.where(Order.created_at >= created_after)
+        if created_before is not None:
+            stmt = stmt.where(Order.created_at < created_before)
+        stmt = apply_keyset(stmt, Order, count, cursor)
+        return split_page(await self._fetch(stmt), count)
+
+    async def get_detailed(self, order_id: UUID) -> Order | None:
+        stmt = select(Order).where(Order.id == order_id).options(*ORDER_DETAILS)
+        return (await self.session.execute(stmt)).unique().scalar_one_or_none()
+
+    async def get_all_detailed(self, count: int, page: int) -> List[Order]:
+        stmt = (
+            select(Order)
+            .options(*ORDER_PAGE_DETAILS)
+            .order_by(Order.created_at, Order.id)
+            .offset(count * page)
+            .limit(count)
+        )
+        return list((await self.session.execute(stmt)).scalars().all())
 
     async def create(self, order_data: OrderCreate) -> Order:
-        order = Order(user_id=order_data.user_id, address_id=order_data.address_id)
-        self.session.add(order)
-        await self.session.flush()
+        if not order_data.product_ids:
+            raise ValueError("Order must contain at least one product")
+        # order_product stores one row per product and has no quantity, so a
+        # repeated id would be charged and reserved but never recorded.
+        repeated = [
+            product_id
+            for product_id, n in Counter(order_data.product_ids).items()
+            if n > 1
+        ]
+        if repeated:
+            listed = ", ".join(sorted(map(str, repeated)))
+            raise ValueError(f"Products listed more than once: {listed}")
 
-        for product_id in order_data.product_ids:
-            stmt = order_product.insert().values(
-                order_id=order.id, product_id=product_id
+        try:
+            await self._check_address(order_data.user_id, order_data.address_id)
+            prices = await self._reserve_stock(order_data.product_ids)
+            order = Order(
+                user_id=order_data.user_id,
+                address_id=order_data.address_id,
+                product_id=order_data.product_ids[0],
+                total=round(sum(prices.values()), 2),
+            )
+            self.session.add(order)
+            await self.session.flush()
+            await self.session.execute(
+                order_product.insert(),
+                [
+                    {"order_id": order.id, "product_id": product_id}
+                    for product_id in order_data.product_ids
+                ],
+            )
+            await self.session.execute(
+                record_order(
+                    self.session.bind.dialect.name,
+                    order.user_id,
+                    order.total,
+                    order.created_at,
+                )
             )
-            await self.session.execute(stmt)
+            await self.session.commit()
+        except Exception:
+            await self.session.rollback()
+            raise
 
-        await self.session.commit()
         await self.session.refresh(order)
-
         return order
 
-    async def delete(self, order_id: UUID) -> None:
-        stmt = select(Order).where(Order.id == order_id)
-        result = await self.session.execute(stmt)
-        order = result.scalar_one_or_none()
+    async def _check_address(self, user_id: UUID, address_id: UUID) -> None:
+        owner = (
+            await self.session.execute(
+                select(Address.user_id)
+                .join(User, User.id == Address.user_id)
+                .where(Address.id == address_id)
+            )
+        ).scalar_one_or_none()
+        if owner is None:
+            raise ValueError(f"Address not found: {address_id}")
+        if owner != user_id:
+            raise ValueError(f"Address {address_id} does not belong to user {user_id}")
 
-        if order:
-            await self.session.delete(order)
+    async def _reserve_stock(self, product_ids: list[UUID]) -> dict[UUID, float]:
+        product_ids = sorted(product_ids)
+        in_order = uuid_in(self.session.bind.dialect.name, Product.id, product_ids)
+
+        found = (
+            await self.session.execute(
+                select(Product.id)
+                .where(in_order)
+                .order_by(Product.id)
+                .with_for_update()
+            )
+        ).scalars()
+        missing = set(product_ids) - set(found)
+        if missing:
+            raise ValueError(
+                f"Products not found: {', '.join(sorted(map(str, missing)))}"
+            )
+
+        reserved = (
+            await self.session.execute(
+                update(Product)
+                .where(in_order, Product.count > 0)
+                .values(count=Product.count - 1)
+                .returning(Product.id, Product.price)
+            )
+        ).all()
+        prices = dict(reserved)
+        short = set(product_ids) - set(prices)
+        if short:
+            raise ValueError(
+                f"Not enough stock for products: {', '.join(sorted(map(str, short)))}"
+            )
+        return prices
+
+    async def delete(self, order_id: UUID) -> None:
+        try:
+            await self.session.execute(
+                delete(order_product).where(order_product.c.order_id == order_id)
+            )
+            deleted = (
+                await self.session.execute(
+                    delete(Order)
+                    .where(Order.id == order_id)
+                    .returning(Order.user_id, Order.total)
+                )
+            ).one_or_none()
+            if deleted is not None:
+                await self.session.execute(forget_order(*deleted))
             await self.session.commit()
+        except Exception:
+            await self.session.rollback()
+            raise
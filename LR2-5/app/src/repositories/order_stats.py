@@ -0,0 +1,117 @@
+from datetime import datetime
+from typing import Sequence
+from uuid import UUID
+
+from entities import Order, Product, User, UserOrderStats, order_product
+from repositories.dialect import upsert, uuid_in
+from sqlalchemy import Executable, case, func, literal, or_, select, update
+
+stats = UserOrderStats.__table__
+
+
+def record_order(
+    dialect_name: str, user_id: UUID, total: float, created_at: datetime
+) -> Executable:
+    stmt = upsert(dialect_name, stats).values(
+        user_id=user_id,
+        order_count=1,
+        total_spent=total,
+        last_order_at=created_at,
+        updated_at=datetime.now(),
+    )
+    return stmt.on_conflict_do_update(
+        index_elements=[stats.c.user_id],
+        set_={
+            "order_count": stats.c.order_count + 1,
+            "total_spent": stats.c.total_spent + stmt.excluded.total_spent,
+            "last_order_at": case(
+                (
+                    or_(
+                        stats.c.last_order_at.is_(None),
+                        stmt.excluded.last_order_at > stats.c.last_order_at,
+                    ),
+                    stmt.excluded.last_order_at,
+                ),
+                else_=stats.c.last_order_at,
+            ),
+            "updated_at": stmt.excluded.updated_at,
+        },
+    )
+
+
+def open_stats(dialect_name: str, user_ids: Sequence[UUID]) -> Executable:
+    now = datetime.now()
+    return (
+        upsert(dialect_name, stats)
+        .values(
+            [
+                {
+                    "user_id": user_id,
+                    "order_count": 0,
+                    "total_spent": 0,
+                    "last_order_at": None,
+                    "updated_at": now,
+                }
+                for user_id in user_ids
+            ]
+        )
+        .on_conflict_do_nothing()
+    )
+
+
+def forget_order(user_id: UUID, total: float | None) -> Executable:
+    return (
+        update(stats)
+        .where(stats.c.user_id == user_id)
+        .values(
+            order_count=stats.c.order_count - 1,
+            total_spent=stats.c.total_spent - (total or 0),
+            last_order_at=select(func.max(Order.created_at))
+            .where(Order.user_id == user_id)
+            .scalar_subquery(),
+            updated_at=datetime.now(),
+        )
+    )
+
+
+def order_total():
+    return (
+        select(func.coalesce(func.sum(Product.price), 0))
+        .select_from(order_product.join(Product))
+        .where(order_product.c.order_id == Order.id)
+        .scalar_subquery()
+    )
+
+
+def backfill_users(dialect_name: str, user_ids: Sequence[UUID]) -> list[Executable]:
+    fill_totals = (
+        update(Order)
+        .where(uuid_in(dialect_name, Order.user_id, user_ids), Order.total.is_(None))
+        .values(total=order_total())
+        .execution_options(synchronize_session=False)
+    )
+    aggregate = (
+        select(
+            User.id,
+            func.count(Order.id),
+            func.coalesce(func.sum(Order.total), 0),
+            func.max(Order.created_at),
+            literal(datetime.now()),
+        )
+        .select_from(User)
+        .outerjoin(Order, Order.user_id == User.id)
+        .where(uuid_in(dialect_name, User.id, user_ids))
+        .group_by(User.id)
+    )
+    stmt = upsert(dialect_name, stats).from_select(
+        ["user_id", "order_count", "total_spent", "last_order_at", "updated_at"],
+        aggregate,
+    )
+    replace = stmt.on_conflict_do_update(
+        index_elements=[stats.c.user_id],
+        set_={
+            column: stmt.excluded[column]
+            for column in ("order_count", "total_spent", "last_order_at", "updated_at")
+        },
+    )
+    return [fill_totals, replace]
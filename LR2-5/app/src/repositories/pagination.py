@@ -0,0 +1,56 @@
+import base64
+import json
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import Select, tuple_
+
+
+def _encode(values: list) -> str:
+    payload = json.dumps(values)
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def _decode(cursor: str) -> list:
+    padded = cursor + "=" * (-len(cursor) % 4)
+    return json.loads(base64.urlsafe_b64decode(padded))
+
+
+def encode_cursor(created_at: datetime, entity_id: UUID) -> str:
+    return _encode([created_at.isoformat(), str(entity_id)])
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    try:
+        created_at, entity_id = _decode(cursor)
+        return datetime.fromisoformat(created_at), UUID(entity_id)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid cursor {cursor!r}") from e
+
+
+def encode_rank_cursor(rank: float, entity_id: UUID) -> str:
+    return _encode([rank, str(entity_id)])
+
+
+def decode_rank_cursor(cursor: str) -> tuple[float, UUID]:
+    try:
+        rank, entity_id = _decode(cursor)
+        return float(rank), UUID(entity_id)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid cursor {cursor!r}") from e
+
+
+def apply_keyset(stmt: Select, model, count: int, cursor: str | None) -> Select:
+    stmt = stmt.order_by(model.created_at, model.id)
+    if cursor is not None:
+        created_at, entity_id = decode_cursor(cursor)
+        stmt = stmt.where(tuple_(model.created_at, model.id) > (created_at, entity_id))
+    return stmt.limit(count + 1)
+
+
+def split_page(rows: list, count: int) -> tuple[list, str | None]:
+    if len(rows) <= count:
+        return rows, None
+    page = rows[:count]
+    last = page[-1]
+    return page, encode_cursor(last.created_at, last.id)
@@ -3,23 +3,19 @@ from uuid import UUID
 
 from dto.produc_dto import ProductCreate, ProductUpdate
 from entities import Product
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from repositories.base_repository import BaseRepository
+from repositories.read_mode import ReadMode
 
 
-class ProductRepository:
-    def __init__(self, session: AsyncSession):
-        self.session = session
+class ProductRepository(BaseRepository):
+    model = Product
 
-    async def get_by_id(self, product_id: UUID) -> Product | None:
-        stmt = select(Product).where(Product.id == product_id)
-        result = await self.session.execute(stmt)
-        return result.scalar_one_or_none()
-
-    async def get_all(self, count: int, page: int) -> List[Product]:
-        stmt = select(Product).offset(count * page).limit(count)
-        result = await self.session.execute(stmt)
-        return list(result.scalars().all())
+    async def get_all(
+        self, count: int, page: int, read_mode: ReadMode = ReadMode.ORM
+    ) -> List[Product]:
+        columns = self._read_columns(None, read_mode)
+        stmt = self._projection(columns).offset(count * page).limit(count)
+        return await self._fetch(stmt, columns)
 
     async def create(self, product_data: ProductCreate) -> Product:
         product = Product(**product_data.model_dump())
@@ -29,26 +25,12 @@ class ProductRepository:
         return product
 
     async def update(self, product_id: UUID, product_data: ProductUpdate) -> Product:
-        stmt = select(Product).where(Product.id == product_id)
-        result = await self.session.execute(stmt)
-        product = result.scalar_one_or_none()
-
+        product = await self._update_by_id(
+            product_id, product_data.model_dump(exclude_unset=True)
+        )
         if not product:
             raise ValueError(f"Product {product_id} not found")
-
-        update_data = product_data.model_dump(exclude_unset=True)
-        for key, value in update_data.items():
-            setattr(product, key, value)
-
-        await self.session.commit()
-        await self.session.refresh(product)
         return product
 
     async def delete(self, product_id: UUID) -> None:
-        stmt = select(Product).where(Product.id == product_id)
-        result = await self.session.execute(stmt)
-        product = result.scalar_one_or_none()
-
-        if product:
-            await self.session.delete(product)
-            await self.session.commit()
+        await self._delete_by_id(product_id)
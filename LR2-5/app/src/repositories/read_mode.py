@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class ReadMode(str, Enum):
+    ORM = "orm"
+    CORE = "core"
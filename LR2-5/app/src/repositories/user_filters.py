@@ -0,0 +1,51 @@
+import operator
+from functools import partial
+from typing import Any, Callable
+
+from entities import User
+from sqlalchemy import ColumnElement, func
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _range_filters(column) -> dict[str, Callable[[Any], ColumnElement]]:
+    name = column.key
+    return {
+        f"{name}__gt": partial(operator.gt, column),
+        f"{name}__gte": partial(operator.ge, column),
+        f"{name}__lt": partial(operator.lt, column),
+        f"{name}__lte": partial(operator.le, column),
+    }
+
+
+USER_FILTERS: dict[str, Callable[[Any], ColumnElement]] = {
+    "id": partial(operator.eq, User.id),
+    "id__in": User.id.in_,
+    "username": partial(operator.eq, User.username),
+    "username__in": User.username.in_,
+    "username__prefix": lambda value: func.lower(User.username).like(
+        _escape_like(value.lower()) + "%", escape="\\"
+    ),
+    "email": partial(operator.eq, User.email),
+    "email__in": User.email.in_,
+    "email__iexact": lambda value: func.lower(User.email) == value.lower(),
+    **_range_filters(User.created_at),
+    **_range_filters(User.updated_at),
+}
+
+
+def normalize_user_filters(kwargs: dict) -> dict:
+    unknown = set(kwargs) - set(USER_FILTERS)
+    if unknown:
+        raise ValueError(f"Unsupported user filters: {', '.join(sorted(unknown))}")
+    return {
+        key: tuple(value) if isinstance(value, (list, set)) else value
+        for key, value in kwargs.items()
+        if value is not None
+    }
+
+
+def user_filter_clauses(filters: dict) -> list[ColumnElement]:
+    return [USER_FILTERS[key](value) for key, value in filters.items()]
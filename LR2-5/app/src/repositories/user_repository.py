@@ -1,69 +1,337 @@
-from typing import List
-from uuid import UUID
+from contextlib import nullcontext
+from datetime import datetime
+from typing import AsyncIterator, List, Sequence
+from uuid import UUID, uuid4
 
+from db.routing import SessionScope
 from dto.user_dto import UserCreate, UserUpdate
-from entities import User
-from sqlalchemy import func, select
-from sqlalchemy.ext.asyncio import AsyncSession
+from entities import User, UserOrderStats
+from repositories.base_repository import BaseRepository
+from repositories.count_strategy import CountStrategy, user_count_cache
+from repositories.dialect import upsert
+from repositories.order_stats import open_stats
+from repositories.pagination import (
+    apply_keyset,
+    decode_rank_cursor,
+    encode_rank_cursor,
+    split_page,
+)
+from repositories.read_mode import ReadMode
+from repositories.user_filters import normalize_user_filters, user_filter_clauses
+from repositories.user_sort import USER_SORT_COLUMNS, UserSort
+from sqlalchemy import (
+    Row,
+    RowMapping,
+    Select,
+    and_,
+    column,
+    func,
+    literal_column,
+    or_,
+    select,
+    table,
+    text,
+)
 
+SEARCH_CONFIG = "english"
 
-class UserRepository:
-    def __init__(self, session: AsyncSession):
-        self.session = session
 
-    async def get_by_id(self, user_id: UUID) -> User | None:
-        stmt = select(User).where(User.id == user_id)
-        result = await self.session.execute(stmt)
-        return result.scalar_one_or_none()
+class UserRepository(BaseRepository):
+    model = User
 
     async def get_by_filter(
-        self, count: int, page: int, **kwargs
-    ) -> tuple[List[User], int]:
-        count_stmt = select(func.count(User.id))
-        for key, value in kwargs.items():
-            if hasattr(User, key):
-                count_stmt = count_stmt.where(getattr(User, key) == value)
-        total = (await self.session.execute(count_stmt)).scalar_one()
+        self,
+        count: int,
+        page: int,
+        count_strategy: CountStrategy = CountStrategy.EXACT,
+        columns: Sequence[str] | None = None,
+        read_mode: ReadMode = ReadMode.ORM,
+        sort: UserSort = UserSort.CREATED_AT,
+        descending: bool = False,
+        **kwargs,
+    ) -> tuple[List[User], int | None, CountStrategy]:
+        filters = normalize_user_filters(kwargs)
+        columns = self._read_columns(columns, read_mode)
+        stmt = self._apply_filters(self._projection(columns), filters)
+        stmt = self._apply_sort(stmt, sort, descending)
+        stmt = stmt.offset(count * page).limit(count)
+
+        if count_strategy == CountStrategy.ESTIMATED:
+            total = None if filters else await self._estimate_total()
+            if total is None:
+                count_strategy = CountStrategy.EXACT
+            else:
+                return await self._fetch(stmt, columns), total, count_strategy
+
+        if count_strategy == CountStrategy.CACHED:
+            total = user_count_cache.get(filters)
+            if total is not None:
+                return await self._fetch(stmt, columns), total, count_strategy
+
+        if count_strategy == CountStrategy.NONE:
+            return await self._fetch(stmt, columns), None, count_strategy
+
+        users, total = await self._fetch_with_total(stmt, filters, page, columns)
+        if count_strategy == CountStrategy.CACHED:
+            user_count_cache.set(filters, total)
+        return users, total, count_strategy
+
+    async def get_order_stats(self, user_id: UUID) -> UserOrderStats | None:
+        stmt = select(UserOrderStats).where(UserOrderStats.user_id == user_id)
+        return (await self.session.execute(stmt)).scalar_one_or_none()
+
+    async def get_list_version(self, **kwargs) -> tuple[datetime | None, int]:
+        filters = normalize_user_filters(kwargs)
+        stmt = self._apply_filters(
+            select(func.max(User.updated_at), func.count(User.id)), filters
+        )
+        return tuple((await self.session.execute(stmt)).one())
 
-        offset = count * page
-        stmt = select(User)
+    async def get_by_cursor(
+        self,
+        count: int,
+        cursor: str | None = None,
+        columns: Sequence[str] | None = None,
+        read_mode: ReadMode = ReadMode.ORM,
+        **kwargs,
+    ) -> tuple[List[User], str | None]:
+        filters = normalize_user_filters(kwargs)
+        columns = self._read_columns(columns, read_mode)
+        stmt = self._apply_filters(self._projection(columns), filters)
+        stmt = apply_keyset(stmt, User, count, cursor)
+        return split_page(await self._fetch(stmt, columns), count)
 
-        for key, value in kwargs.items():
-            if hasattr(User, key):
-                stmt = stmt.where(getattr(User, key) == value)
+    async def stream(
+        self,
+        batch_size: int = 1000,
+        columns: Sequence[str] | None = None,
+        session_scope: SessionScope | None = None,
+        **kwargs,
+    ) -> AsyncIterator[Sequence[RowMapping]]:
+        filters = normalize_user_filters(kwargs)
+        projection = self._projection(self._read_columns(columns, ReadMode.CORE))
+        stmt = (
+            self._apply_filters(projection, filters)
+            .order_by(User.created_at, User.id)
+            .execution_options(yield_per=batch_size)
+        )
+        # The response body is sent after the request-scoped session is closed,
+        # so HTTP exports pass a scope that opens a routed session of their own.
+        scope = session_scope() if session_scope else nullcontext(self.session)
+        async with scope as session:
+            result = await session.stream(stmt)
+            async for batch in result.mappings().partitions():
+                yield batch
 
-        stmt = stmt.offset(offset).limit(count)
-        result = await self.session.execute(stmt)
-        return list(result.scalars().all()), total
+    async def search(
+        self,
+        query: str,
+        count: int,
+        cursor: str | None = None,
+        read_mode: ReadMode = ReadMode.ORM,
+    ) -> tuple[List[User], str | None]:
+        if not query.split():
+            return [], None
+        ranked = self._ranked_matches(query).subquery()
+        projection = self._projection(self._read_columns(None, read_mode))
+        stmt = (
+            projection.add_columns(ranked.c.rank)
+            .join(ranked, ranked.c.id == User.id)
+            .order_by(ranked.c.rank.desc(), User.id)
+            .limit(count + 1)
+        )
+        if cursor is not None:
+            rank, user_id = decode_rank_cursor(cursor)
+            stmt = stmt.where(
+                or_(
+                    ranked.c.rank < rank,
+                    and_(ranked.c.rank == rank, User.id > user_id),
+                )
+            )
+
+        rows = (await self.session.execute(stmt)).all()
+        users = [row if read_mode == ReadMode.CORE else row[0] for row in rows]
+        if len(rows) <= count:
+            return users, None
+        return users[:count], encode_rank_cursor(
+            rows[count - 1].rank, users[count - 1].id
+        )
 
     async def create(self, user_data: UserCreate) -> User:
         user = User(**user_data.model_dump())
         self.session.add(user)
+        await self.session.flush()
+        await self.session.execute(
+            open_stats(self.session.bind.dialect.name, [user.id])
+        )
         await self.session.commit()
         await self.session.refresh(user)
+        user_count_cache.clear()
         return user
 
-    async def update(self, user_id: UUID, user_data: UserUpdate) -> User:
-        stmt = select(User).where(User.id == user_id)
-        result = await self.session.execute(stmt)
-        user = result.scalar_one_or_none()
+    # Every chunk is committed on its own, so when a later chunk fails the
+    # users inserted by earlier chunks stay in the database.
+    async def create_many(
+        self, users_data: List[UserCreate], chunk_size: int = 1000
+    ) -> List[tuple[Row | None, List[str]]]:
+        results, pending = self._prepare_bulk(users_data)
+        for start in range(0, len(pending), chunk_size):
+            chunk = pending[start : start + chunk_size]
+            for index, result in (await self._insert_chunk(chunk)).items():
+                results[index] = result
 
-        if not user:
-            raise ValueError(f"User {user_id} not found")
+        user_count_cache.clear()
+        return results
 
-        update_data = user_data.model_dump(exclude_unset=True)
-        for key, value in update_data.items():
-            setattr(user, key, value)
+    @staticmethod
+    def _prepare_bulk(
+        users_data: List[UserCreate],
+    ) -> tuple[List[tuple[Row | None, List[str]]], List[tuple[int, dict]]]:
+        results: List[tuple[Row | None, List[str]]] = []
+        seen_usernames: set[str] = set()
+        seen_emails: set[str] = set()
+        pending: List[tuple[int, dict]] = []
 
+        for user_data in users_data:
+            duplicates = []
+            if user_data.username in seen_usernames:
+                duplicates.append("username")
+            if user_data.email in seen_emails:
+                duplicates.append("email")
+            seen_usernames.add(user_data.username)
+            seen_emails.add(user_data.email)
+            results.append((None, duplicates))
+            if not duplicates:
+                now = datetime.now()
+                row = user_data.model_dump() | {
+                    "id": uuid4(),
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                pending.append((len(results) - 1, row))
+        return results, pending
+
+    async def _insert_chunk(
+        self, chunk: List[tuple[int, dict]]
+    ) -> dict[int, tuple[Row | None, List[str]]]:
+        stmt = (
+            upsert(self.session.bind.dialect.name, User)
+            .values([row for _, row in chunk])
+            .on_conflict_do_nothing()
+            .returning(*User.__table__.c)
+        )
+        inserted = {row.id: row for row in await self.session.execute(stmt)}
+        if inserted:
+            await self.session.execute(
+                open_stats(self.session.bind.dialect.name, list(inserted))
+            )
+        conflicts = await self._find_conflicts(
+            [row for _, row in chunk if row["id"] not in inserted]
+        )
         await self.session.commit()
-        await self.session.refresh(user)
+
+        return {
+            index: (
+                (inserted[row["id"]], [])
+                if row["id"] in inserted
+                else (None, conflicts[row["id"]])
+            )
+            for index, row in chunk
+        }
+
+    async def update(self, user_id: UUID, user_data: UserUpdate) -> User:
+        user = await self._update_by_id(
+            user_id, user_data.model_dump(exclude_unset=True)
+        )
+        if not user:
+            raise ValueError(f"User {user_id} not found")
         return user
 
     async def delete(self, user_id: UUID) -> None:
-        stmt = select(User).where(User.id == user_id)
-        result = await self.session.execute(stmt)
-        user = result.scalar_one_or_none()
+        if await self._delete_by_id(user_id):
+            user_count_cache.clear()
+
+    @staticmethod
+    def _apply_filters(stmt: Select, filters: dict) -> Select:
+        return stmt.where(*user_filter_clauses(filters))
+
+    @staticmethod
+    def _apply_sort(stmt: Select, sort: UserSort, descending: bool) -> Select:
+        key = USER_SORT_COLUMNS[sort]
+        if sort != UserSort.CREATED_AT:
+            stmt = stmt.join(UserOrderStats, UserOrderStats.user_id == User.id)
+            key = key.desc() if descending else key.asc()
+            if sort == UserSort.LAST_ORDER_AT:
+                key = key.nulls_last()
+            return stmt.order_by(key, User.id)
+        if descending:
+            return stmt.order_by(key.desc(), User.id.desc())
+        return stmt.order_by(key, User.id)
+
+    def _ranked_matches(self, query: str) -> Select:
+        if self.session.bind.dialect.name == "postgresql":
+            tsquery = func.plainto_tsquery(SEARCH_CONFIG, query)
+            search_vector = literal_column("users.search_vector")
+            return select(
+                User.id.label("id"),
+                func.ts_rank(search_vector, tsquery).label("rank"),
+            ).where(search_vector.op("@@")(tsquery))
+
+        terms = " ".join('"' + term.replace('"', '""') + '"' for term in query.split())
+        users_fts = table("users_fts", column("user_id"))
+        return select(
+            users_fts.c.user_id.label("id"),
+            (-func.bm25(literal_column("users_fts"))).label("rank"),
+        ).where(text("users_fts MATCH :terms").bindparams(terms=terms))
+
+    async def _find_conflicts(self, rows: List[dict]) -> dict[UUID, List[str]]:
+        if not rows:
+            return {}
+        usernames = [row["username"] for row in rows]
+        emails = [row["email"] for row in rows]
+        stmt = select(User.username, User.email).where(
+            or_(User.username.in_(usernames), User.email.in_(emails))
+        )
+        existing = (await self.session.execute(stmt)).all()
+        taken_usernames = {username for username, _ in existing}
+        taken_emails = {email for _, email in existing}
+
+        conflicts = {}
+        for row in rows:
+            fields = []
+            if row["username"] in taken_usernames:
+                fields.append("username")
+            if row["email"] in taken_emails:
+                fields.append("email")
+            # The row lost a race with a user that is gone again by now.
+            conflicts[row["id"]] = fields or ["unique"]
+        return conflicts
+
+    async def _fetch_with_total(
+        self,
+        stmt: Select,
+        filters: dict,
+        page: int,
+        columns: Sequence[str] | None = None,
+    ) -> tuple[List[User], int]:
+        stmt = stmt.add_columns(func.count().over().label("total"))
+        rows = (await self.session.execute(stmt)).all()
+        if rows:
+            users = [row[0] for row in rows] if columns is None else rows
+            return users, rows[0].total
+        if page == 0:
+            return [], 0
+
+        count_stmt = self._apply_filters(select(func.count(User.id)), filters)
+        return [], (await self.session.execute(count_stmt)).scalar_one()
 
-        if user:
-            await self.session.delete(user)
-            await self.session.commit()
+    async def _estimate_total(self) -> int | None:
+        if self.session.bind.dialect.name != "postgresql":
+            return None
+        stmt = text(
+            "SELECT reltuples::bigint FROM pg_class WHERE oid = 'users'::regclass"
+        )
+        estimate = (await self.session.execute(stmt)).scalar_one_or_none()
+        if estimate is None or estimate < 0:
+            return None
+        return estimate
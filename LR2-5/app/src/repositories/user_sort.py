@@ -0,0 +1,18 @@
+from enum import Enum
+
+from entities import User, UserOrderStats
+
+
+class UserSort(str, Enum):
+    CREATED_AT = "created_at"
+    ORDER_COUNT = "order_count"
+    TOTAL_SPENT = "total_spent"
+    LAST_ORDER_AT = "last_order_at"
+
+
+USER_SORT_COLUMNS = {
+    UserSort.CREATED_AT: User.created_at,
+    UserSort.ORDER_COUNT: UserOrderStats.order_count,
+    UserSort.TOTAL_SPENT: UserOrderStats.total_spent,
+    UserSort.LAST_ORDER_AT: UserOrderStats.last_order_at,
+}
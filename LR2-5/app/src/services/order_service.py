@@ -1,9 +1,10 @@
+from datetime import datetime
 from typing import List
 from uuid import UUID
 
 from dto.order_dto import OrderCreate
+from entities import Order
 from repositories.order_repository import OrderRepository
-from src.entities import Order
 
 
 class OrderService:
@@ -13,6 +14,24 @@ class OrderService:
     async def get_by_id(self, order_id: UUID) -> Order:
         return await self.order_repository.get_by_id(order_id)
 
+    async def get_page_by_user(
+        self,
+        user_id: UUID,
+        count: int,
+        cursor: str | None = None,
+        created_after: datetime | None = None,
+        created_before: datetime | None = None,
+    ) -> tuple[List[Order], str | None]:
+        return await self.order_repository.get_page_by_user(
+            user_id, count, cursor, created_after, created_before
+        )
+
+    async def get_detailed(self, order_id: UUID) -> Order | None:
+        return await self.order_repository.get_detailed(order_id)
+
+    async def get_all_detailed(self, count: int, page: int) -> List[Order]:
+        return await self.order_repository.get_all_detailed(count, page)
+
     async def get_all(self, count: int, page: int) -> List[Order]:
         return await self.order_repository.get_all(count, page)
 
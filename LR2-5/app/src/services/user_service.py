@@ -1,8 +1,13 @@
+from datetime import datetime
+from typing import AsyncIterator, Sequence
 from uuid import UUID
 
 from dto.user_dto import UserCreate, UserUpdate
-from entities import User
+from entities import User, UserOrderStats
+from repositories.count_strategy import CountStrategy
+from repositories.read_mode import ReadMode
 from repositories.user_repository import UserRepository
+from sqlalchemy import Row, RowMapping
 
 
 class UserService:
@@ -12,16 +17,59 @@ class UserService:
     async def get_by_id(self, user_id: UUID) -> User | None:
         return await self.user_repository.get_by_id(user_id)
 
+    async def get_columns_by_id(
+        self, user_id: UUID, columns: Sequence[str]
+    ) -> Row | None:
+        return await self.user_repository.get_columns_by_id(user_id, columns)
+
+    async def get_version(self, user_id: UUID) -> datetime | None:
+        return await self.user_repository.get_version(user_id)
+
+    async def get_order_stats(self, user_id: UUID) -> UserOrderStats | None:
+        return await self.user_repository.get_order_stats(user_id)
+
+    async def get_list_version(self, **kwargs) -> tuple[datetime | None, int]:
+        return await self.user_repository.get_list_version(**kwargs)
+
+    async def get_many(
+        self, user_ids: list[UUID], read_mode: ReadMode = ReadMode.ORM
+    ) -> dict[UUID, User]:
+        return await self.user_repository.get_many(user_ids, read_mode=read_mode)
+
     async def get_by_filter(
         self, count: int, page: int, **kwargs
-    ) -> tuple[list[User], int]:
+    ) -> tuple[list[User], int | None, CountStrategy]:
         return await self.user_repository.get_by_filter(
             count=count, page=page, **kwargs
         )
 
+    async def get_by_cursor(
+        self, count: int, cursor: str | None = None, **kwargs
+    ) -> tuple[list[User], str | None]:
+        return await self.user_repository.get_by_cursor(
+            count=count, cursor=cursor, **kwargs
+        )
+
+    def stream(self, **kwargs) -> AsyncIterator[Sequence[RowMapping]]:
+        return self.user_repository.stream(**kwargs)
+
+    async def search(
+        self,
+        query: str,
+        count: int,
+        cursor: str | None = None,
+        read_mode: ReadMode = ReadMode.ORM,
+    ) -> tuple[list[User], str | None]:
+        return await self.user_repository.search(query, count, cursor, read_mode)
+
     async def create(self, user_data: UserCreate) -> User:
         return await self.user_repository.create(user_data)
 
+    async def create_many(
+        self, users_data: list[UserCreate]
+    ) -> list[tuple[Row | None, list[str]]]:
+        return await self.user_repository.create_many(users_data)
+
     async def update(self, user_id: UUID, user_data: UserUpdate) -> User:
         return await self.user_repository.update(user_id, user_data)
 
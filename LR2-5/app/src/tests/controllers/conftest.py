@@ -0,0 +1,85 @@
+from uuid import UUID
+
+import pytest
+from controllers.order_controller import OrderController
+from controllers.product_controller import ProductController
+from controllers.user_controller import UserController
+from db.query_stats import QueryCounter, QueryStatsMiddleware
+from db.routing import SessionScope
+from entities import Address, Base, User, UserOrderStats
+from litestar import Litestar
+from litestar.di import Provide
+from litestar.testing import TestClient
+from main import (
+    provide_order_repository,
+    provide_order_service,
+    provide_product_repository,
+    provide_product_service,
+    provide_user_repository,
+    provide_user_service,
+)
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+
+@pytest.fixture
+def buyer():
+    return {
+        "user_id": UUID("00000000-0000-4000-8000-000000000001"),
+        "address_id": UUID("00000000-0000-4000-8000-000000000002"),
+    }
+
+
+@pytest.fixture
+def api_client(tmp_path, buyer):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'api.db'}")
+    QueryCounter().attach(engine)
+    session_factory = async_sessionmaker(
+        engine, class_=AsyncSession, expire_on_commit=False
+    )
+
+    async def create_tables() -> None:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+            await conn.execute(
+                User.__table__.insert().values(
+                    id=buyer["user_id"], username="buyer", email="buyer@example.com"
+                )
+            )
+            await conn.execute(
+                UserOrderStats.__table__.insert().values(user_id=buyer["user_id"])
+            )
+            await conn.execute(
+                Address.__table__.insert().values(
+                    id=buyer["address_id"],
+                    user_id=buyer["user_id"],
+                    street="1 Main St",
+                    city="Springfield",
+                    country="US",
+                )
+            )
+
+    async def provide_db_session() -> AsyncSession:
+        async with session_factory() as session:
+            yield session
+
+    async def provide_stream_session() -> SessionScope:
+        return session_factory
+
+    app = Litestar(
+        route_handlers=[UserController, ProductController, OrderController],
+        dependencies={
+            "db_session": Provide(provide_db_session),
+            "stream_session": Provide(provide_stream_session),
+            "user_repository": Provide(provide_user_repository),
+            "user_service": Provide(provide_user_service),
+            "product_repository": Provide(provide_product_repository),
+            "product_service": Provide(provide_product_service),
+            "order_repository": Provide(provide_order_repository),
+            "order_service": Provide(provide_order_service),
+        },
+        on_startup=[create_tables],
+        on_shutdown=[engine.dispose],
+        middleware=[QueryStatsMiddleware()],
+    )
+    with TestClient(app=app) as client:
+        yield client
@@ -0,0 +1,213 @@
+from uuid import uuid4
+
+
+def create_products(api_client, count: int, stock: int = 100) -> list[str]:
+    return [
+        api_client.post(
+            "/products", json={"name": f"Product {index}", "price": 1, "count": stock}
+        ).json()["id"]
+        for index in range(count)
+    ]
+
+
+def place_order(api_client, buyer, product_ids: list[str]):
+    return api_client.post(
+        "/orders",
+        json={
+            "user_id": str(buyer["user_id"]),
+            "address_id": str(buyer["address_id"]),
+            "product_ids": product_ids,
+        },
+    )
+
+
+class TestOrderController:
+    def test_create_order_returns_address_and_products(self, api_client, buyer):
+        product_ids = create_products(api_client, 2, stock=5)
+
+        response = place_order(api_client, buyer, product_ids)
+
+        assert response.status_code == 201
+        order = response.json()
+        assert order["address"]["id"] == str(buyer["address_id"])
+        assert sorted(product["id"] for product in order["products"]) == sorted(
+            product_ids
+        )
+        assert {product["count"] for product in order["products"]} == {4}
+
+    def test_get_order_by_id_uses_one_query(self, api_client, buyer):
+        product_ids = create_products(api_client, 3)
+        order_id = place_order(api_client, buyer, product_ids).json()["id"]
+
+        response = api_client.get(f"/orders/{order_id}")
+
+        assert response.status_code == 200
+        assert len(response.json()["products"]) == 3
+        assert response.headers["X-DB-Query-Count"] == "1"
+
+    def test_order_page_query_count_does_not_grow_with_page_size(
+        self, api_client, buyer
+    ):
+        product_ids = create_products(api_client, 5)
+        for index in range(30):
+            place_order(api_client, buyer, product_ids[: 1 + index % 5])
+
+        small = api_client.get("/orders", params={"count": 3})
+        large = api_client.get("/orders", params={"count": 30})
+
+        assert len(small.json()["orders"]) == 3
+        assert len(large.json()["orders"]) == 30
+        assert small.headers["X-DB-Query-Count"] == "2"
+        assert large.headers["X-DB-Query-Count"] == "2"
+
+    def test_create_order_with_unknown_product_returns_400(self, api_client, buyer):
+        response = place_order(api_client, buyer, [str(uuid4())])
+
+        assert response.status_code == 400
+        assert response.json()["detail"].startswith("Заказ не оформлен")
+
+    def test_create_order_for_unknown_user_returns_400(self, api_client, buyer):
+        product_ids = create_products(api_client, 1)
+
+        response = place_order(api_client, buyer | {"user_id": uuid4()}, product_ids)
+
+        assert response.status_code == 400
+        assert "does not belong" in response.json()["detail"]
+        assert api_client.get(f"/products/{product_ids[0]}").json()["count"] == 100
+
+    def test_create_order_with_unknown_address_returns_400(self, api_client, buyer):
+        product_ids = create_products(api_client, 1)
+
+        response = place_order(api_client, buyer | {"address_id": uuid4()}, product_ids)
+
+        assert response.status_code == 400
+        assert "Address not found" in response.json()["detail"]
+
+    def test_create_order_with_repeated_product_returns_400(self, api_client, buyer):
+        (product_id,) = create_products(api_client, 1)
+
+        response = place_order(api_client, buyer, [product_id, product_id])
+
+        assert response.status_code == 400
+        assert "more than once" in response.json()["detail"]
+
+    def test_get_missing_order_returns_404(self, api_client):
+        order_id = uuid4()
+
+        response = api_client.get(f"/orders/{order_id}")
+
+        assert response.status_code == 404
+        assert response.json()["detail"] == f"Заказ с Id {order_id} не найден"
+
+
+class TestUserOrders:
+    def test_orders_are_paged_with_a_cursor(self, api_client, buyer):
+        product_ids = create_products(api_client, 3)
+        placed = [
+            place_order(api_client, buyer, product_ids[: 1 + index % 3]).json()["id"]
+            for index in range(7)
+        ]
+
+        seen, cursor, query_counts = [], None, set()
+        while True:
+            params = {"count": 3} | ({"cursor": cursor} if cursor else {})
+            response = api_client.get(
+                f"/users/{buyer['user_id']}/orders", params=params
+            )
+            assert response.status_code == 200
+            query_counts.add(response.headers["X-DB-Query-Count"])
+            seen.extend(order["id"] for order in response.json()["orders"])
+            cursor = response.json()["next_cursor"]
+            if cursor is None:
+                break
+
+        assert seen == placed
+        assert query_counts == {"2"}
+
+    def test_orders_are_filtered_by_date_range(self, api_client, buyer):
+        product_ids = create_products(api_client, 1)
+        place_order(api_client, buyer, product_ids)
+        url = f"/users/{buyer['user_id']}/orders"
+
+        before = api_client.get(url, params={"created_before": "2000-01-01T00:00:00"})
+        after = api_client.get(url, params={"created_after": "2000-01-01T00:00:00"})
+
+        assert before.json()["orders"] == []
+        assert len(after.json()["orders"]) == 1
+
+    def test_unknown_user_returns_404(self, api_client):
+        response = api_client.get(f"/users/{uuid4()}/orders")
+
+        assert response.status_code == 404
+
+    def test_invalid_cursor_returns_400(self, api_client, buyer):
+        response = api_client.get(
+            f"/users/{buyer['user_id']}/orders", params={"cursor": "garbage"}
+        )
+
+        assert response.status_code == 400
+
+
+class TestUserStats:
+    def test_stats_follow_placed_and_deleted_orders(self, api_client, buyer):
+        product_ids = create_products(api_client, 2)
+        url = f"/users/{buyer['user_id']}/stats"
+        empty = api_client.get(url).json()
+
+        first = place_order(api_client, buyer, product_ids).json()
+        second = place_order(api_client, buyer, product_ids[:1]).json()
+        placed = api_client.get(url).json()
+        api_client.delete(f"/orders/{second['id']}")
+        after_delete = api_client.get(url).json()
+
+        assert empty["order_count"] == 0
+        assert empty["last_order_at"] is None
+        assert placed["order_count"] == 2
+        assert placed["total_spent"] == 3
+        assert placed["last_order_at"] == second["created_at"]
+        assert after_delete["order_count"] == 1
+        assert after_delete["total_spent"] == first["total"]
+        assert after_delete["last_order_at"] == first["created_at"]
+
+    def test_stats_of_unknown_user_return_404(self, api_client):
+        response = api_client.get(f"/users/{uuid4()}/stats")
+
+        assert response.status_code == 404
+
+    def test_users_can_be_sorted_by_total_spent(self, api_client, buyer):
+        product_ids = create_products(api_client, 1)
+        place_order(api_client, buyer, product_ids)
+        api_client.post(
+            "/users",
+            json={"username": "idle", "email": "idle@example.com", "description": ""},
+        )
+
+        response = api_client.get(
+            "/users", params={"sort": "total_spent", "descending": True}
+        )
+        users = response.json()["users"]
+
+        assert response.status_code == 200
+        assert [user["username"] for user in users] == ["buyer", "idle"]
+
+    def test_users_without_orders_sort_as_zero(self, api_client, buyer):
+        product_ids = create_products(api_client, 1)
+        place_order(api_client, buyer, product_ids)
+        api_client.post(
+            "/users",
+            json={"username": "idle", "email": "idle@example.com", "description": ""},
+        )
+
+        response = api_client.get("/users", params={"sort": "order_count"})
+
+        assert [user["username"] for user in response.json()["users"]] == [
+            "idle",
+            "buyer",
+        ]
+
+    def test_cursor_requires_the_default_sort(self, api_client):
+        response = api_client.get(
+            "/users", params={"sort": "order_count", "cursor": "anything"}
+        )
+
+        assert response.status_code == 400
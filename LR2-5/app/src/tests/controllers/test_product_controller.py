@@ -0,0 +1,33 @@
+from uuid import uuid4
+
+
+class TestProductController:
+    def test_create_and_get_product(self, api_client):
+        created = api_client.post(
+            "/products", json={"name": "Lamp", "price": 12.5, "count": 3}
+        )
+        found = api_client.get(f"/products/{created.json()['id']}")
+
+        assert created.status_code == 201
+        assert found.status_code == 200
+        assert found.json() == created.json()
+        assert found.headers["X-DB-Query-Count"] == "1"
+
+    def test_list_products_is_paginated(self, api_client):
+        for index in range(3):
+            api_client.post(
+                "/products", json={"name": f"Book {index}", "price": 1, "count": 1}
+            )
+
+        response = api_client.get("/products", params={"count": 2, "page": 1})
+
+        assert response.status_code == 200
+        assert len(response.json()) == 1
+
+    def test_update_missing_product_returns_404(self, api_client):
+        product_id = uuid4()
+
+        response = api_client.put(f"/products/{product_id}", json={"count": 1})
+
+        assert response.status_code == 404
+        assert response.json()["detail"] == f"Товар с Id {product_id} не найден"
@@ -6,13 +6,18 @@ import pytest_asyncio
 from controllers.user_controller import UserController
 from dto.user_dto import UserCreate, UserListResponse, UserResponse, UserUpdate
 from litestar.exceptions import NotFoundException
+from repositories.count_strategy import CountStrategy
+from repositories.read_mode import ReadMode
+from repositories.user_sort import UserSort
 from services.user_service import UserService
 
 
 class TestUserController:
     @pytest_asyncio.fixture
     def mock_user_service(self):
-        return AsyncMock(spec=UserService)
+        user_service = AsyncMock(spec=UserService)
+        user_service.get_list_version.return_value = (None, 0)
+        return user_service
 
     @pytest_asyncio.fixture
     def user_controller(self):
@@ -32,7 +37,7 @@ class TestUserController:
 
         result = await user_controller.get_user_by_id(mock_user_service, sample_uuid)
 
-        assert isinstance(result, UserResponse)
+        assert isinstance(result.content, UserResponse)
         mock_user_service.get_by_id.assert_called_once_with(sample_uuid)
 
     @pytest.mark.asyncio
@@ -52,16 +57,28 @@ class TestUserController:
     ):
         mock_users = [Mock(), Mock()]
         total_count = 2
-        mock_user_service.get_by_filter.return_value = (mock_users, total_count)
+        mock_user_service.get_by_filter.return_value = (
+            mock_users,
+            total_count,
+            CountStrategy.EXACT,
+        )
 
         result = await user_controller.get_all_users(
             mock_user_service, count=10, page=0
         )
 
-        assert isinstance(result, UserListResponse)
-        assert len(result.users) == 2
-        assert result.total == total_count
-        mock_user_service.get_by_filter.assert_called_once_with(count=10, page=0)
+        assert isinstance(result.content, UserListResponse)
+        assert len(result.content.users) == 2
+        assert result.content.total == total_count
+        mock_user_service.get_by_filter.assert_called_once_with(
+            count=10,
+            page=0,
+            count_strategy=CountStrategy.EXACT,
+            columns=None,
+            read_mode=ReadMode.CORE,
+            sort=UserSort.CREATED_AT,
+            descending=False,
+        )
 
     @pytest.mark.asyncio
     async def test_get_all_users_with_custom_pagination_params(
@@ -69,14 +86,26 @@ class TestUserController:
     ):
         mock_users = [Mock()]
         total_count = 1
-        mock_user_service.get_by_filter.return_value = (mock_users, total_count)
+        mock_user_service.get_by_filter.return_value = (
+            mock_users,
+            total_count,
+            CountStrategy.EXACT,
+        )
 
         result = await user_controller.get_all_users(mock_user_service, count=5, page=2)
 
-        assert isinstance(result, UserListResponse)
-        assert len(result.users) == 1
-        assert result.total == 1
-        mock_user_service.get_by_filter.assert_called_once_with(count=5, page=2)
+        assert isinstance(result.content, UserListResponse)
+        assert len(result.content.users) == 1
+        assert result.content.total == 1
+        mock_user_service.get_by_filter.assert_called_once_with(
+            count=5,
+            page=2,
+            count_strategy=CountStrategy.EXACT,
+            columns=None,
+            read_mode=ReadMode.CORE,
+            sort=UserSort.CREATED_AT,
+            descending=False,
+        )
 
     @pytest.mark.asyncio
     async def test_create_user_returns_user_response(
@@ -130,9 +159,21 @@ class TestUserController:
         mock_user_service.get_by_id.assert_called_with(sample_uuid)
 
         mock_user_service.reset_mock()
-        mock_user_service.get_by_filter.return_value = ([Mock()], 1)
+        mock_user_service.get_by_filter.return_value = (
+            [Mock()],
+            1,
+            CountStrategy.EXACT,
+        )
         await user_controller.get_all_users(mock_user_service, count=20, page=1)
-        mock_user_service.get_by_filter.assert_called_with(count=20, page=1)
+        mock_user_service.get_by_filter.assert_called_with(
+            count=20,
+            page=1,
+            count_strategy=CountStrategy.EXACT,
+            columns=None,
+            read_mode=ReadMode.CORE,
+            sort=UserSort.CREATED_AT,
+            descending=False,
+        )
 
         mock_user_service.reset_mock()
         user_create_data = Mock(spec=UserCreate)
@@ -151,3 +192,89 @@ class TestUserController:
         mock_user_service.reset_mock()
         await user_controller.delete_user(mock_user_service, sample_uuid)
         mock_user_service.delete.assert_called_with(sample_uuid)
+
+
+class TestUserExport:
+    def test_export_streams_through_its_own_session(self, api_client):
+        created = api_client.post(
+            "/users",
+            json={
+                "username": "exported",
+                "email": "exported@example.com",
+                "description": "",
+            },
+        )
+        assert created.status_code == 201
+
+        response = api_client.get("/users/export", params={"fields": "username"})
+
+        assert response.status_code == 200
+        assert [line for line in response.text.splitlines() if line] == [
+            '{"username":"buyer"}',
+            '{"username":"exported"}',
+        ]
+
+    def test_export_does_not_report_an_incomplete_query_count(self, api_client):
+        response = api_client.get("/users/export")
+
+        assert response.status_code == 200
+        assert "X-DB-Query-Count" not in response.headers
+
+
+class TestUserListValidators:
+    def test_plain_list_carries_an_etag(self, api_client):
+        response = api_client.get("/users")
+
+        assert response.status_code == 200
+        assert response.headers["ETag"]
+        assert "Last-Modified" not in response.headers
+
+    def test_matching_etag_is_answered_with_304(self, api_client):
+        first = api_client.get("/users")
+
+        second = api_client.get(
+            "/users", headers={"If-None-Match": first.headers["ETag"]}
+        )
+
+        assert second.status_code == 304
+        assert second.headers["X-DB-Query-Count"] == "1"
+
+    def test_deleting_a_user_changes_the_list_etag(self, api_client):
+        created = api_client.post(
+            "/users",
+            json={"username": "gone", "email": "gone@example.com", "description": ""},
+        ).json()
+        before = api_client.get("/users").headers["ETag"]
+
+        api_client.delete(f"/users/{created['id']}")
+        after = api_client.get("/users", headers={"If-None-Match": before})
+
+        assert after.status_code == 200
+        assert after.headers["ETag"] != before
+        assert [user["username"] for user in after.json()["users"]] == ["buyer"]
+
+    def test_if_modified_since_is_ignored_for_lists(self, api_client):
+        response = api_client.get(
+            "/users", headers={"If-Modified-Since": "Fri, 01 Jan 2100 00:00:00 GMT"}
+        )
+
+        assert response.status_code == 200
+
+    def test_stats_sorted_list_is_validated_by_its_body(self, api_client):
+        first = api_client.get("/users", params={"sort": "order_count"})
+
+        second = api_client.get(
+            "/users",
+            params={"sort": "order_count"},
+            headers={"If-None-Match": first.headers["ETag"]},
+        )
+
+        assert second.status_code == 304
+
+
+class TestUserSearch:
+    def test_blank_query_returns_an_empty_page(self, api_client):
+        response = api_client.get("/users/search", params={"q": "   "})
+
+        assert response.status_code == 200
+        assert response.json()["users"] == []
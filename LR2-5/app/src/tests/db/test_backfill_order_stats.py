@@ -0,0 +1,55 @@
+import pytest
+from backfill_order_stats import backfill
+from entities import Base, Order, UserOrderStats
+from seed import address_rows, insert_rows, order_rows, product_rows, user_rows
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import create_async_engine
+
+
+class TestBackfillOrderStats:
+    @pytest.mark.asyncio
+    async def test_stats_match_the_order_history(self, tmp_path):
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'stats.db'}")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        for rows in (
+            user_rows(0, 0, 30, 30),
+            address_rows(0, 0, 30, 30),
+            product_rows(0, 0, 5, 5),
+            order_rows(0, 0, 100, 100, 30, 5),
+        ):
+            await insert_rows(engine, rows)
+
+        processed = await backfill(engine, chunk_size=7)
+        async with engine.connect() as conn:
+            stats = {
+                row.user_id: row
+                for row in await conn.execute(select(UserOrderStats.__table__))
+            }
+            history = {
+                row.user_id: row
+                for row in await conn.execute(
+                    select(
+                        Order.user_id,
+                        func.count(Order.id).label("order_count"),
+                        func.sum(Order.total).label("total_spent"),
+                        func.max(Order.created_at).label("last_order_at"),
+                    ).group_by(Order.user_id)
+                )
+            }
+            missing_totals = (
+                await conn.execute(select(func.count()).where(Order.total.is_(None)))
+            ).scalar_one()
+        await engine.dispose()
+
+        assert processed == 30
+        assert missing_totals == 0
+        assert len(stats) == 30
+        for user_id in set(stats) - set(history):
+            assert stats[user_id].order_count == 0
+            assert stats[user_id].total_spent == 0
+            assert stats[user_id].last_order_at is None
+        for user_id, expected in history.items():
+            assert stats[user_id].order_count == expected.order_count
+            assert stats[user_id].total_spent == pytest.approx(expected.total_spent)
+            assert stats[user_id].last_order_at == expected.last_order_at
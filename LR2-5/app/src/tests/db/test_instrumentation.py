@@ -0,0 +1,61 @@
+import logging
+
+import pytest
+from db.instrumentation import (
+    QueryLogger,
+    current_repository_method,
+    current_route,
+    instrument_repositories,
+)
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+
+class FakeBase:
+    async def get_by_id(self, engine):
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+        return current_repository_method.get()
+
+
+class FakeRepository(FakeBase):
+    async def find(self, engine):
+        return await self.get_by_id(engine), current_repository_method.get()
+
+
+class TestQueryLogger:
+    @pytest.mark.asyncio
+    async def test_slow_statements_are_logged_with_route_and_method(self, caplog):
+        engine = create_async_engine("sqlite+aiosqlite://")
+        QueryLogger(threshold_ms=0).attach(engine)
+        instrument_repositories(FakeBase)
+        current_route.set("GET /users")
+
+        with caplog.at_level(logging.INFO, logger="db.queries"):
+            inner, outer = await FakeRepository().find(engine)
+        await engine.dispose()
+
+        assert (inner, outer) == ("FakeRepository.get_by_id", "FakeRepository.find")
+        assert current_repository_method.get() is None
+        record = caplog.records[-1]
+        assert record.levelno == logging.WARNING
+        assert "route=GET /users" in record.getMessage()
+        assert "repository=FakeRepository.get_by_id" in record.getMessage()
+        assert record.getMessage().endswith("SELECT 1")
+
+    @pytest.mark.asyncio
+    async def test_fast_statements_are_sampled(self, caplog):
+        engine = create_async_engine("sqlite+aiosqlite://")
+        QueryLogger(threshold_ms=60_000, sample_rate=1).attach(engine)
+        quiet = create_async_engine("sqlite+aiosqlite://")
+        QueryLogger(threshold_ms=60_000, sample_rate=0).attach(quiet)
+
+        with caplog.at_level(logging.INFO, logger="db.queries"):
+            for target in (engine, quiet):
+                async with target.connect() as conn:
+                    await conn.execute(text("SELECT 2"))
+        await engine.dispose()
+        await quiet.dispose()
+
+        assert [record.levelno for record in caplog.records] == [logging.INFO]
+        assert caplog.records[0].getMessage().startswith("sampled query")
@@ -0,0 +1,94 @@
+import pytest
+from db.instrumentation import instrument_repositories
+from db.metrics import CacheCollector, PoolCollector, repository_latency
+from db.pool import create_engine_from_env
+from prometheus_client import CollectorRegistry, generate_latest
+from repositories.cache import EntityCache
+
+
+class FakeBase:
+    async def get_all(self):
+        return []
+
+
+class FakeProductRepository(FakeBase):
+    pass
+
+
+class FakeCacheMixin:
+    async def get_by_id(self, entity_id):
+        return await self.get_many([entity_id])
+
+
+class FakeUserBase:
+    async def get_many(self, entity_ids):
+        return entity_ids
+
+
+class FakeCachedUserRepository(FakeCacheMixin, FakeUserBase):
+    pass
+
+
+class TestMetrics:
+    @pytest.mark.asyncio
+    async def test_pool_collector_exports_pool_gauges(self, tmp_path):
+        engine = create_engine_from_env(f"sqlite+aiosqlite:///{tmp_path / 'm.db'}")
+        registry = CollectorRegistry()
+        registry.register(PoolCollector({"primary": engine}))
+
+        async with engine.connect():
+            exported = generate_latest(registry).decode()
+        await engine.dispose()
+
+        assert 'app_db_pool_checked_out{pool="primary"} 1.0' in exported
+        assert 'app_db_pool_checkouts_total{pool="primary"} 1.0' in exported
+
+    def test_cache_collector_exports_cache_counters(self):
+        cache = EntityCache(maxsize=1, ttl=60)
+        cache.set("a", b"a")
+        cache.get("a")
+        cache.get("missing")
+        cache.set("b", b"b")
+        registry = CollectorRegistry()
+        registry.register(CacheCollector({"user": cache}))
+
+        exported = generate_latest(registry).decode()
+
+        assert 'app_cache_size{cache="user"} 1.0' in exported
+        assert 'app_cache_hits_total{cache="user"} 1.0' in exported
+        assert 'app_cache_misses_total{cache="user"} 1.0' in exported
+        assert 'app_cache_evictions_total{cache="user"} 1.0' in exported
+
+    @pytest.mark.asyncio
+    async def test_repository_calls_are_observed(self):
+        calls = []
+        instrument_repositories(
+            FakeBase,
+            lambda repository, method, elapsed: calls.append((repository, method)),
+        )
+
+        await FakeProductRepository().get_all()
+
+        assert calls == [("FakeProductRepository", "get_all")]
+
+    @pytest.mark.asyncio
+    async def test_mixin_methods_are_observed_once(self):
+        calls = []
+        instrument_repositories(
+            FakeUserBase,
+            lambda repository, method, elapsed: calls.append((repository, method)),
+        )
+
+        await FakeCachedUserRepository().get_by_id(1)
+
+        assert calls == [("FakeCachedUserRepository", "get_by_id")]
+
+    def test_repository_histogram_labels(self):
+        repository_latency.labels("UserRepository", "get_by_id").observe(0.002)
+
+        exported = generate_latest().decode()
+
+        assert (
+            'app_repository_duration_seconds_bucket{le="0.0025",method="get_by_id",'
+            'repository="UserRepository"}'
+        ) in exported
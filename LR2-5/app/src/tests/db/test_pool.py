@@ -0,0 +1,73 @@
+import asyncio
+
+import pytest
+from db.pool import create_engine_from_env, pool_options_from_env, pool_stats, warm_up
+from sqlalchemy import text
+
+
+class TestPool:
+    @pytest.mark.asyncio
+    async def test_warm_up_opens_connections_and_reports_stats(
+        self, tmp_path, monkeypatch
+    ):
+        monkeypatch.setenv("DB_POOL_SIZE", "4")
+        engine = create_engine_from_env(f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}")
+
+        await warm_up(engine, 3, [text("SELECT 1")])
+        stats = pool_stats(engine)
+        async with engine.connect():
+            busy = pool_stats(engine)
+        await engine.dispose()
+
+        assert stats["size"] == 4
+        assert stats["idle"] == 3
+        assert stats["checked_out"] == 0
+        assert stats["checkouts"] == 3
+        assert stats["waits"] == 0
+        assert busy["checked_out"] == 1
+        assert busy["idle"] == 2
+
+    @pytest.mark.asyncio
+    async def test_only_blocked_checkouts_count_as_waits(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("DB_POOL_SIZE", "1")
+        monkeypatch.setenv("DB_MAX_OVERFLOW", "0")
+        engine = create_engine_from_env(f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}")
+
+        async def checkout() -> None:
+            async with engine.connect():
+                pass
+
+        async with engine.connect():
+            waiting = asyncio.create_task(checkout())
+            await asyncio.sleep(0.05)
+        await waiting
+        stats = pool_stats(engine)
+        await engine.dispose()
+
+        assert stats["checkouts"] == 2
+        assert stats["waits"] == 1
+        assert stats["wait_time_total_ms"] >= 40
+
+    def test_options_are_read_from_env(self, monkeypatch):
+        monkeypatch.setenv("DB_POOL_SIZE", "20")
+        monkeypatch.setenv("DB_MAX_OVERFLOW", "0")
+        monkeypatch.setenv("DB_POOL_PRE_PING", "true")
+
+        options = pool_options_from_env("postgresql+asyncpg://localhost/app")
+
+        assert options["pool_size"] == 20
+        assert options["max_overflow"] == 0
+        assert options["pool_pre_ping"] is True
+
+    def test_pre_ping_is_off_by_default(self, monkeypatch):
+        monkeypatch.delenv("DB_POOL_PRE_PING", raising=False)
+
+        options = pool_options_from_env("postgresql+asyncpg://localhost/app")
+
+        assert options["pool_pre_ping"] is False
+
+    def test_in_memory_sqlite_has_no_queue_pool(self):
+        engine = create_engine_from_env("sqlite+aiosqlite://")
+
+        assert "pool_size" not in pool_options_from_env("sqlite+aiosqlite://")
+        assert pool_stats(engine) is None
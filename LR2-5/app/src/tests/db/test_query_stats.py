@@ -0,0 +1,67 @@
+import logging
+
+import pytest
+from db.query_stats import QueryCounter, QueryStatsMiddleware
+from litestar import Litestar, get
+from litestar.testing import TestClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+
+@pytest.fixture
+def engine():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    QueryCounter().attach(engine)
+    return engine
+
+
+def make_app(engine, strict: bool = False) -> Litestar:
+    @get("/single", opt={"query_budget": 1})
+    async def single() -> str:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+        return "ok"
+
+    @get("/loop", opt={"query_budget": 2})
+    async def loop() -> str:
+        async with engine.connect() as conn:
+            for i in range(4):
+                await conn.execute(text("SELECT :i"), {"i": i})
+        return "ok"
+
+    return Litestar(
+        route_handlers=[single, loop],
+        middleware=[QueryStatsMiddleware(repeat_threshold=3, strict=strict)],
+    )
+
+
+class TestQueryStatsMiddleware:
+    def test_headers_report_query_count_and_time(self, engine):
+        with TestClient(app=make_app(engine)) as client:
+            response = client.get("/single")
+
+        assert response.status_code == 200
+        assert response.headers["X-DB-Query-Count"] == "1"
+        assert float(response.headers["X-DB-Time-Ms"]) >= 0
+
+    def test_repeated_statements_are_flagged(self, engine, caplog):
+        with caplog.at_level(logging.WARNING, logger="db.queries"):
+            with TestClient(app=make_app(engine)) as client:
+                response = client.get("/loop")
+
+        assert response.status_code == 200
+        assert response.headers["X-DB-Query-Count"] == "4"
+        messages = [record.getMessage() for record in caplog.records]
+        assert any("budget is 2" in message for message in messages)
+        assert any(
+            message.startswith("possible N+1 in GET /loop: statement ran 4 times")
+            for message in messages
+        )
+
+    def test_strict_mode_fails_requests_over_budget(self, engine):
+        with TestClient(app=make_app(engine, strict=True)) as client:
+            assert client.get("/single").status_code == 200
+            response = client.get("/loop")
+
+        assert response.status_code == 500
+        assert response.text == "GET /loop issued 4 queries, budget is 2"
@@ -0,0 +1,85 @@
+import pytest
+import pytest_asyncio
+from db.routing import ReadYourWritesWindow, ReplicaStrategy, SessionRouter
+from dto.user_dto import UserCreate
+from entities import Base
+from repositories.user_repository import UserRepository
+from sqlalchemy.ext.asyncio import create_async_engine
+
+
+@pytest_asyncio.fixture
+async def engines(tmp_path):
+    engines = [
+        create_async_engine(f"sqlite+aiosqlite:///{tmp_path / name}.db")
+        for name in ("primary", "replica1", "replica2")
+    ]
+    for engine in engines:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+    yield engines
+    for engine in engines:
+        await engine.dispose()
+
+
+def database_of(session) -> str:
+    return session.bind.url.database.rsplit("/", 1)[-1]
+
+
+class TestSessionRouter:
+    @pytest.mark.asyncio
+    async def test_reads_go_to_replicas_and_writes_to_primary(self, engines):
+        router = SessionRouter(engines[0], engines[1:])
+
+        async with router.session(read_only=False) as session:
+            assert database_of(session) == "primary.db"
+        async with router.session(read_only=True) as session:
+            first = database_of(session)
+        async with router.session(read_only=True) as session:
+            second = database_of(session)
+
+        assert {first, second} == {"replica1.db", "replica2.db"}
+
+    @pytest.mark.asyncio
+    async def test_reads_use_primary_without_replicas(self, engines):
+        router = SessionRouter(engines[0])
+
+        async with router.session(read_only=True) as session:
+            assert database_of(session) == "primary.db"
+
+    @pytest.mark.asyncio
+    async def test_writer_reads_own_writes_within_window(self, engines):
+        router = SessionRouter(engines[0], engines[1:], window=ReadYourWritesWindow(60))
+
+        async with router.session(read_only=False, client="writer") as session:
+            user = await UserRepository(session).create(
+                UserCreate(
+                    username="Pinned", email="pinned@example.com", description=""
+                )
+            )
+        async with router.session(read_only=True, client="writer") as session:
+            own_read = await UserRepository(session).get_by_id(user.id)
+        async with router.session(read_only=True, client="other") as session:
+            other_read = await UserRepository(session).get_by_id(user.id)
+
+        assert own_read is not None
+        assert other_read is None
+
+    @pytest.mark.asyncio
+    async def test_least_busy_avoids_replica_in_use(self, engines):
+        router = SessionRouter(
+            engines[0], engines[1:], strategy=ReplicaStrategy.LEAST_BUSY
+        )
+
+        async with router.session(read_only=True) as busy:
+            async with router.session(read_only=True) as session:
+                assert database_of(session) != database_of(busy)
+            assert sorted(router.in_flight) == [0, 1]
+        assert router.in_flight == [0, 0]
+
+    def test_window_expires(self, monkeypatch):
+        window = ReadYourWritesWindow(5)
+        window.pin("client")
+        assert window.is_pinned("client")
+
+        monkeypatch.setattr("db.routing.time.monotonic", lambda: float("inf"))
+        assert not window.is_pinned("client")
@@ -0,0 +1,39 @@
+import pytest
+from entities import Base, Order, User, order_product
+from seed import insert_rows, order_rows, user_rows
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import create_async_engine
+
+
+class TestSeed:
+    def test_rows_are_deterministic_per_seed(self):
+        first = order_rows(7, 0, 50, 50, 20, 10)
+        second = order_rows(7, 0, 50, 50, 20, 10)
+        other = order_rows(8, 0, 50, 50, 20, 10)
+
+        assert first == second
+        assert first[Order.__table__] != other[Order.__table__]
+
+    def test_ids_depend_only_on_index(self):
+        whole = user_rows(3, 0, 20, 20)[User.__table__]
+        tail = user_rows(3, 10, 20, 20)[User.__table__]
+
+        assert [row["id"] for row in whole[10:]] == [row["id"] for row in tail]
+
+    @pytest.mark.asyncio
+    async def test_insert_rows_reports_counts_per_table(self, tmp_path):
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'seed.db'}")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+        await insert_rows(engine, user_rows(0, 0, 20, 20))
+        inserted = await insert_rows(engine, order_rows(0, 0, 30, 30, 20, 5))
+        async with engine.connect() as conn:
+            links = (
+                await conn.execute(select(func.count()).select_from(order_product))
+            ).scalar_one()
+        await engine.dispose()
+
+        assert inserted["orders"] == 30
+        assert inserted["order_product"] == links
+        assert 30 <= links <= 150
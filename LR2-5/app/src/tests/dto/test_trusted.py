@@ -0,0 +1,66 @@
+import json
+import uuid
+from datetime import datetime
+
+import pytest
+from dto.produc_dto import ProductResponse
+from dto.trusted import encode_struct, encode_trusted, encode_trusted_lines
+from dto.user_dto import UserListResponse, UserResponse
+from entities import Product, User
+
+
+class TestTrustedSerialization:
+    def test_list_response_matches_validated_output(self):
+        now = datetime.now()
+        users = [
+            User(
+                id=uuid.uuid4(),
+                username=f"trusted{i}",
+                email=f"trusted{i}@example.com",
+                description="Trusted",
+                created_at=now,
+                updated_at=now,
+            )
+            for i in range(3)
+        ]
+        validated = UserListResponse(
+            users=[UserResponse.model_validate(user) for user in users], total=3
+        )
+
+        trusted = encode_trusted(
+            UserListResponse, users=UserResponse.to_structs(users), total=3
+        )
+
+        assert json.loads(trusted) == json.loads(validated.model_dump_json())
+
+    def test_mappings_are_encoded_as_lines(self):
+        product_id = uuid.uuid4()
+        row = {"id": product_id, "name": "Book", "price": 10.5, "count": 3}
+
+        lines = encode_trusted_lines(ProductResponse.to_structs([row, row]))
+
+        assert lines.count(b"\n") == 2
+        assert json.loads(lines.splitlines()[0]) == json.loads(
+            ProductResponse.model_validate(row).model_dump_json()
+        )
+
+    def test_selected_fields_keep_only_requested_keys(self):
+        now = datetime.now()
+        user = User(
+            id=uuid.uuid4(),
+            username="partial",
+            email="partial@example.com",
+            description=None,
+            created_at=now,
+            updated_at=now,
+        )
+
+        fields = UserResponse.select_fields("email, id,email")
+        payload = encode_struct(UserResponse.to_structs([user], fields)[0])
+
+        assert fields == ("email", "id")
+        assert json.loads(payload) == {"email": user.email, "id": str(user.id)}
+
+    def test_select_fields_rejects_unknown_field(self):
+        with pytest.raises(ValueError):
+            UserResponse.select_fields("id,password")
@@ -0,0 +1,122 @@
+import pytest
+from dto.order_dto import OrderCreate
+from dto.produc_dto import ProductCreate, ProductResponse, ProductUpdate
+from dto.user_dto import UserCreate, UserResponse, UserUpdate
+from entities import Address
+from repositories.cache import (
+    CachedProductRepository,
+    CachedUserRepository,
+    EntityCache,
+    ProductCacheOrderRepository,
+)
+
+
+class TestCachedRepository:
+    @pytest.mark.asyncio
+    async def test_get_by_id_is_served_from_cache(self, session):
+        cache = EntityCache(maxsize=10, ttl=60)
+        repository = CachedUserRepository(session, cache)
+        user = await repository.create(
+            UserCreate(username="Cached", email="cached@example.com", description="")
+        )
+
+        first = await repository.get_by_id(user.id)
+        second = await repository.get_by_id(user.id)
+
+        assert isinstance(first, UserResponse)
+        assert first.id == user.id
+        assert isinstance(second, UserResponse)
+        assert second.username == "Cached"
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_update_and_delete_invalidate_entry(self, session):
+        cache = EntityCache(maxsize=10, ttl=60)
+        repository = CachedUserRepository(session, cache)
+        user = await repository.create(
+            UserCreate(username="Stale", email="stale@example.com", description="")
+        )
+        await repository.get_by_id(user.id)
+
+        await repository.update(user.id, UserUpdate(description="Fresh"))
+        updated = await repository.get_by_id(user.id)
+        assert updated.description == "Fresh"
+
+        await repository.delete(user.id)
+        assert await repository.get_by_id(user.id) is None
+
+    @pytest.mark.asyncio
+    async def test_product_repository_is_cached_the_same_way(self, session):
+        cache = EntityCache(maxsize=10, ttl=60)
+        repository = CachedProductRepository(session, cache)
+        product = await repository.create(
+            ProductCreate(name="Cached", price=10, count=1)
+        )
+
+        await repository.get_by_id(product.id)
+        await repository.update(product.id, ProductUpdate(count=2))
+        cached = await repository.get_by_id(product.id)
+
+        assert cached.count == 2
+        assert cache.stats()["hits"] == 0
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = EntityCache(maxsize=2, ttl=60)
+        cache.set("a", b"a")
+        cache.set("b", b"b")
+        cache.get("a")
+        cache.set("c", b"c")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == b"a"
+        assert cache.stats()["evictions"] == 1
+
+    def test_expired_entry_is_a_miss(self):
+        cache = EntityCache(maxsize=2, ttl=-1)
+        cache.set("a", b"a")
+
+        assert cache.get("a") is None
+        assert cache.stats()["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_get_many_uses_cache_for_known_ids(self, session):
+        cache = EntityCache(maxsize=10, ttl=60)
+        repository = CachedUserRepository(session, cache)
+        first = await repository.create(
+            UserCreate(username="BatchCached1", email="bc1@example.com", description="")
+        )
+        second = await repository.create(
+            UserCreate(username="BatchCached2", email="bc2@example.com", description="")
+        )
+        await repository.get_by_id(first.id)
+
+        found = await repository.get_many([first.id, second.id])
+
+        assert isinstance(found[first.id], UserResponse)
+        assert found[second.id].id == second.id
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["size"] == 2
+
+    @pytest.mark.asyncio
+    async def test_checkout_invalidates_reserved_products(self, session):
+        cache = EntityCache(maxsize=10, ttl=60)
+        products = CachedProductRepository(session, cache)
+        user = await CachedUserRepository(session, cache).create(
+            UserCreate(username="CacheBuyer", email="cb@example.com", description="")
+        )
+        address = Address(user_id=user.id, street="s", city="c", country="c")
+        session.add(address)
+        await session.commit()
+        product = await products.create(
+            ProductCreate(name="CachedStock", price=1, count=3)
+        )
+        await products.get_by_id(product.id)
+
+        await ProductCacheOrderRepository(session, cache).create(
+            OrderCreate(
+                user_id=user.id, address_id=address.id, product_ids=[product.id]
+            )
+        )
+
+        assert (await products.get_by_id(product.id)).count == 2
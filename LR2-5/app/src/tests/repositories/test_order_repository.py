@@ -1,11 +1,14 @@
+import uuid
+
 import pytest
 from dto.order_dto import OrderCreate
 from dto.produc_dto import ProductCreate
 from dto.user_dto import UserCreate
-from entities import Address
+from entities import Address, Product, UserOrderStats, order_product
 from repositories.order_repository import OrderRepository
 from repositories.product_repository import ProductRepository
 from repositories.user_repository import UserRepository
+from sqlalchemy import func, select
 
 
 class TestOrderRepository:
@@ -26,7 +29,7 @@ class TestOrderRepository:
             )
         )
 
-        address = await Address(
+        address = Address(
             user_id=user.id,
             street="createAddress",
             city="createAddress",
@@ -49,12 +52,14 @@ class TestOrderRepository:
         assert order is not None
         assert order.user_id == user.id
         assert order.address_id == address.id
+        assert order.product_id == product.id
 
     @pytest.mark.asyncio
     async def test_get_order_by_id(
         self,
         order_repository: OrderRepository,
         user_repository: UserRepository,
+        product_repository: ProductRepository,
         session,
     ):
         user = await user_repository.create(
@@ -73,8 +78,14 @@ class TestOrderRepository:
         await session.commit()
         await session.refresh(address)
 
+        product = await product_repository.create(
+            ProductCreate(name="getByIdProduct", price=100, count=10)
+        )
+
         order = await order_repository.create(
-            OrderCreate(user_id=user.id, address_id=address.id, product_ids=[])
+            OrderCreate(
+                user_id=user.id, address_id=address.id, product_ids=[product.id]
+            )
         )
 
         found_order = await order_repository.get_by_id(order.id)
@@ -82,3 +93,182 @@ class TestOrderRepository:
         assert found_order is not None
         assert found_order.user_id == user.id
         assert found_order.address_id == address.id
+
+    @pytest.mark.asyncio
+    async def test_create_reserves_stock_and_inserts_lines(
+        self,
+        order_repository: OrderRepository,
+        user_repository: UserRepository,
+        product_repository: ProductRepository,
+        session,
+    ):
+        user, address = await self._user_with_address(
+            user_repository, session, "reserve"
+        )
+        book = await product_repository.create(
+            ProductCreate(name="reserveBook", price=10, count=5)
+        )
+        lamp = await product_repository.create(
+            ProductCreate(name="reserveLamp", price=20, count=1)
+        )
+
+        order = await order_repository.create(
+            OrderCreate(
+                user_id=user.id,
+                address_id=address.id,
+                product_ids=[book.id, lamp.id],
+            )
+        )
+        lines = (
+            await session.execute(
+                select(func.count())
+                .select_from(order_product)
+                .where(order_product.c.order_id == order.id)
+            )
+        ).scalar_one()
+
+        assert order.product_id == book.id
+        assert lines == 2
+        assert order.total == 30
+        assert (await product_repository.get_by_id(book.id)).count == 4
+        assert (await product_repository.get_by_id(lamp.id)).count == 0
+
+    @pytest.mark.asyncio
+    async def test_create_without_stock_changes_nothing(
+        self,
+        order_repository: OrderRepository,
+        user_repository: UserRepository,
+        product_repository: ProductRepository,
+        session,
+    ):
+        user, address = await self._user_with_address(
+            user_repository, session, "outOfStock"
+        )
+        book = await product_repository.create(
+            ProductCreate(name="outOfStockBook", price=10, count=5)
+        )
+        lamp = await product_repository.create(
+            ProductCreate(name="outOfStockLamp", price=20, count=0)
+        )
+
+        user_id, book_id, lamp_id = user.id, book.id, lamp.id
+
+        with pytest.raises(ValueError, match="Not enough stock"):
+            await order_repository.create(
+                OrderCreate(
+                    user_id=user_id,
+                    address_id=address.id,
+                    product_ids=[book_id, lamp_id],
+                )
+            )
+        stock = dict((await session.execute(select(Product.id, Product.count))).all())
+
+        assert stock[book_id] == 5
+        assert stock[lamp_id] == 0
+        assert await order_repository.get_by_user(user_id) == []
+
+    @pytest.mark.asyncio
+    async def test_create_rejects_repeated_products(
+        self,
+        order_repository: OrderRepository,
+        user_repository: UserRepository,
+        product_repository: ProductRepository,
+        session,
+    ):
+        user, address = await self._user_with_address(
+            user_repository, session, "repeated"
+        )
+        book = await product_repository.create(
+            ProductCreate(name="repeatedBook", price=10, count=5)
+        )
+
+        with pytest.raises(ValueError, match="more than once"):
+            await order_repository.create(
+                OrderCreate(
+                    user_id=user.id,
+                    address_id=address.id,
+                    product_ids=[book.id, book.id],
+                )
+            )
+
+        assert (await product_repository.get_by_id(book.id)).count == 5
+
+    @pytest.mark.asyncio
+    async def test_create_with_unknown_product_fails(
+        self,
+        order_repository: OrderRepository,
+        user_repository: UserRepository,
+        session,
+    ):
+        user, address = await self._user_with_address(
+            user_repository, session, "unknownProduct"
+        )
+        missing_id = uuid.uuid4()
+
+        with pytest.raises(ValueError, match=str(missing_id)):
+            await order_repository.create(
+                OrderCreate(
+                    user_id=user.id, address_id=address.id, product_ids=[missing_id]
+                )
+            )
+
+    @pytest.mark.asyncio
+    async def test_create_and_delete_maintain_user_stats(
+        self,
+        order_repository: OrderRepository,
+        user_repository: UserRepository,
+        product_repository: ProductRepository,
+        session,
+    ):
+        user, address = await self._user_with_address(user_repository, session, "stats")
+        book = await product_repository.create(
+            ProductCreate(name="statsBook", price=10.5, count=10)
+        )
+        lamp = await product_repository.create(
+            ProductCreate(name="statsLamp", price=20, count=10)
+        )
+
+        first = await order_repository.create(
+            OrderCreate(
+                user_id=user.id,
+                address_id=address.id,
+                product_ids=[book.id, lamp.id],
+            )
+        )
+        second = await order_repository.create(
+            OrderCreate(user_id=user.id, address_id=address.id, product_ids=[lamp.id])
+        )
+        placed = await self._stats(session, user.id)
+
+        await order_repository.delete(second.id)
+        after_delete = await self._stats(session, user.id)
+
+        assert first.total == 30.5
+        assert placed == (2, 50.5, second.created_at)
+        assert after_delete == (1, 30.5, first.created_at)
+
+    @staticmethod
+    async def _stats(session, user_id) -> tuple:
+        return tuple(
+            (
+                await session.execute(
+                    select(
+                        UserOrderStats.order_count,
+                        UserOrderStats.total_spent,
+                        UserOrderStats.last_order_at,
+                    ).where(UserOrderStats.user_id == user_id)
+                )
+            ).one()
+        )
+
+    @staticmethod
+    async def _user_with_address(
+        user_repository: UserRepository, session, name: str
+    ) -> tuple:
+        user = await user_repository.create(
+            UserCreate(username=name, email=f"{name}@example.com", description=name)
+        )
+        address = Address(user_id=user.id, street=name, city=name, country=name)
+        session.add(address)
+        await session.commit()
+        return user, address
@@ -1,6 +1,10 @@
+from uuid import uuid4
+
 import pytest
-from dto.produc_dto import ProductCreate, ProductUpdate
+from dto.produc_dto import ProductCreate, ProductResponse, ProductUpdate
+from entities import Product
 from repositories.product_repository import ProductRepository
+from repositories.read_mode import ReadMode
 
 
 class TestProductRepository:
@@ -66,3 +70,32 @@ class TestProductRepository:
         assert find_product is not None
         assert find_product.name == product.name
         assert find_product.price == product.price
+
+    @pytest.mark.asyncio
+    async def test_update_missing_product_raises(
+        self, product_repository: ProductRepository
+    ):
+        with pytest.raises(ValueError):
+            await product_repository.update(uuid4(), ProductUpdate(price=1))
+
+    @pytest.mark.asyncio
+    async def test_delete_missing_product_is_noop(
+        self, product_repository: ProductRepository
+    ):
+        await product_repository.delete(uuid4())
+
+    @pytest.mark.asyncio
+    async def test_core_read_mode_returns_untracked_rows(
+        self, product_repository: ProductRepository
+    ):
+        product = await product_repository.create(
+            ProductCreate(name="Core", price=1.5, count=2)
+        )
+
+        row = await product_repository.get_by_id(product.id, ReadMode.CORE)
+        rows = await product_repository.get_all(100, 0, ReadMode.CORE)
+
+        assert row.name == "Core"
+        assert not isinstance(row, Product)
+        assert product.id in {row.id for row in rows}
+        assert ProductResponse.model_validate(row).count == 2
@@ -1,5 +1,9 @@
+from uuid import uuid4
+
 import pytest
 from dto.user_dto import UserCreate, UserUpdate
+from repositories.count_strategy import CountStrategy
+from repositories.read_mode import ReadMode
 from repositories.user_repository import UserRepository
 
 
@@ -74,3 +78,372 @@ class TestUserRepository:
         users = await user_repository.get_by_filter(2, 0)
 
         assert len(users[0]) == 2
+
+    @pytest.mark.asyncio
+    async def test_get_users_by_cursor_walks_all_pages(
+        self, user_repository: UserRepository
+    ):
+        for i in range(5):
+            await user_repository.create(
+                UserCreate(
+                    username=f"Cursor{i}",
+                    email=f"cursor{i}@example.com",
+                    description="Cursor",
+                )
+            )
+        _, total, _ = await user_repository.get_by_filter(1, 0)
+
+        seen = []
+        cursor = None
+        while True:
+            users, cursor = await user_repository.get_by_cursor(2, cursor)
+            seen.extend(user.id for user in users)
+            if cursor is None:
+                break
+
+        assert len(seen) == total
+        assert len(set(seen)) == total
+
+    @pytest.mark.asyncio
+    async def test_get_users_by_cursor_rejects_invalid_cursor(
+        self, user_repository: UserRepository
+    ):
+        with pytest.raises(ValueError):
+            await user_repository.get_by_cursor(2, "not-a-cursor")
+
+    @pytest.mark.asyncio
+    async def test_get_users_total_matches_across_count_strategies(
+        self, user_repository: UserRepository
+    ):
+        await user_repository.create(
+            UserCreate(username="Counted", email="counted@example.com", description="")
+        )
+        _, exact, _ = await user_repository.get_by_filter(1, 0)
+
+        _, estimated, strategy = await user_repository.get_by_filter(
+            1, 0, count_strategy=CountStrategy.ESTIMATED
+        )
+        assert estimated == exact
+        assert strategy == CountStrategy.EXACT
+
+        _, cached, strategy = await user_repository.get_by_filter(
+            1, 0, count_strategy=CountStrategy.CACHED
+        )
+        assert cached == exact
+        assert strategy == CountStrategy.CACHED
+
+        _, total, strategy = await user_repository.get_by_filter(
+            1, 0, count_strategy=CountStrategy.NONE
+        )
+        assert total is None
+        assert strategy == CountStrategy.NONE
+
+    @pytest.mark.asyncio
+    async def test_cached_total_is_invalidated_on_create(
+        self, user_repository: UserRepository
+    ):
+        _, before, _ = await user_repository.get_by_filter(
+            1, 0, count_strategy=CountStrategy.CACHED
+        )
+        await user_repository.create(
+            UserCreate(username="Invalidated", email="inv@example.com", description="")
+        )
+
+        _, after, _ = await user_repository.get_by_filter(
+            1, 0, count_strategy=CountStrategy.CACHED
+        )
+
+        assert after == before + 1
+
+    @pytest.mark.asyncio
+    async def test_exact_total_past_last_page(self, user_repository: UserRepository):
+        _, exact, _ = await user_repository.get_by_filter(1, 0)
+
+        users, total, _ = await user_repository.get_by_filter(10, 10_000)
+
+        assert users == []
+        assert total == exact
+
+    @pytest.mark.asyncio
+    async def test_create_many_reports_conflicts_without_aborting(
+        self, user_repository: UserRepository
+    ):
+        await user_repository.create(
+            UserCreate(username="BulkTaken", email="bulk0@example.com", description="")
+        )
+
+        results = await user_repository.create_many(
+            [
+                UserCreate(username="Bulk1", email="bulk1@example.com", description=""),
+                UserCreate(
+                    username="BulkTaken", email="bulk2@example.com", description=""
+                ),
+                UserCreate(username="Bulk3", email="bulk1@example.com", description=""),
+                UserCreate(username="Bulk4", email="bulk4@example.com", description=""),
+            ],
+            chunk_size=2,
+        )
+
+        assert [conflicts for _, conflicts in results] == [
+            [],
+            ["username"],
+            ["email"],
+            [],
+        ]
+        assert results[0][0].username == "Bulk1"
+        assert results[3][0].username == "Bulk4"
+        assert await user_repository.get_by_id(results[3][0].id) is not None
+
+    @pytest.mark.asyncio
+    async def test_new_users_start_with_empty_order_stats(
+        self, user_repository: UserRepository
+    ):
+        single = await user_repository.create(
+            UserCreate(username="Fresh0", email="fresh0@example.com", description="")
+        )
+        results = await user_repository.create_many(
+            [UserCreate(username="Fresh1", email="fresh1@example.com", description="")]
+        )
+
+        for user_id in (single.id, results[0][0].id):
+            stats = await user_repository.get_order_stats(user_id)
+            assert (stats.order_count, stats.total_spent, stats.last_order_at) == (
+                0,
+                0,
+                None,
+            )
+
+    @pytest.mark.asyncio
+    async def test_unexplained_bulk_conflict_is_still_reported(
+        self, user_repository: UserRepository
+    ):
+        row = {"id": uuid4(), "username": "Vanished", "email": "gone@example.com"}
+
+        conflicts = await user_repository._find_conflicts([row])
+
+        assert conflicts == {row["id"]: ["unique"]}
+
+    @pytest.mark.asyncio
+    async def test_update_missing_user_raises(self, user_repository: UserRepository):
+        with pytest.raises(ValueError):
+            await user_repository.update(uuid4(), UserUpdate(description="Missing"))
+
+    @pytest.mark.asyncio
+    async def test_update_user_bumps_updated_at(self, user_repository: UserRepository):
+        user = await user_repository.create(
+            UserCreate(username="Bumped", email="bumped@example.com", description="")
+        )
+        created_updated_at = user.updated_at
+
+        updated_user = await user_repository.update(
+            user.id, UserUpdate(description="Bumped")
+        )
+
+        assert updated_user.updated_at > created_updated_at
+        assert updated_user.created_at == user.created_at
+
+    @pytest.mark.asyncio
+    async def test_get_users_with_operator_filters(
+        self, user_repository: UserRepository
+    ):
+        first = await user_repository.create(
+            UserCreate(
+                username="FilterAlpha", email="Alpha@Example.com", description=""
+            )
+        )
+        second = await user_repository.create(
+            UserCreate(username="filterbeta", email="beta@example.com", description="")
+        )
+        await user_repository.create(
+            UserCreate(username="Filter_x", email="gamma@example.com", description="")
+        )
+
+        by_prefix, total, _ = await user_repository.get_by_filter(
+            10, 0, username__prefix="filtera"
+        )
+        assert [user.id for user in by_prefix] == [first.id]
+        assert total == 1
+
+        by_email, _, _ = await user_repository.get_by_filter(
+            10, 0, email__iexact="alpha@example.COM"
+        )
+        assert [user.id for user in by_email] == [first.id]
+
+        by_ids, _, _ = await user_repository.get_by_filter(
+            10, 0, id__in=[first.id, second.id]
+        )
+        assert {user.id for user in by_ids} == {first.id, second.id}
+
+        by_range, _, _ = await user_repository.get_by_filter(
+            10, 0, created_at__gte=second.created_at, username__prefix="filter"
+        )
+        assert [user.username for user in by_range] == ["filterbeta", "Filter_x"]
+
+        escaped, _, _ = await user_repository.get_by_filter(
+            10, 0, username__prefix="filter_"
+        )
+        assert [user.username for user in escaped] == ["Filter_x"]
+
+    @pytest.mark.asyncio
+    async def test_get_users_rejects_unindexed_filter(
+        self, user_repository: UserRepository
+    ):
+        with pytest.raises(ValueError):
+            await user_repository.get_by_filter(10, 0, description="Developer")
+
+    @pytest.mark.asyncio
+    async def test_search_ranks_and_paginates_descriptions(
+        self, user_repository: UserRepository
+    ):
+        await user_repository.create_many(
+            [
+                UserCreate(
+                    username=f"Searcher{i}",
+                    email=f"searcher{i}@example.com",
+                    description=description,
+                )
+                for i, description in enumerate(
+                    [
+                        "Gardener who loves tomatoes",
+                        "Tomatoes, tomatoes and more tomatoes",
+                        "Tomato sauce enthusiast",
+                        "Plays chess on weekends",
+                    ]
+                )
+            ]
+        )
+
+        first_page, cursor = await user_repository.search("tomatoes", 2)
+        second_page, last_cursor = await user_repository.search("tomatoes", 2, cursor)
+
+        usernames = [user.username for user in first_page + second_page]
+        assert usernames[0] == "Searcher1"
+        assert sorted(usernames) == ["Searcher0", "Searcher1", "Searcher2"]
+        assert last_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_search_follows_description_updates(
+        self, user_repository: UserRepository
+    ):
+        user = await user_repository.create(
+            UserCreate(
+                username="Renamed", email="renamed@example.com", description="violin"
+            )
+        )
+        await user_repository.update(user.id, UserUpdate(description="saxophone"))
+
+        old, _ = await user_repository.search("violin", 10)
+        new, _ = await user_repository.search("saxophone", 10)
+
+        assert [found.id for found in old] == []
+        assert [found.id for found in new] == [user.id]
+
+    @pytest.mark.asyncio
+    async def test_blank_search_finds_nothing(self, user_repository: UserRepository):
+        assert await user_repository.search("   ", 10) == ([], None)
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_every_user_in_batches(
+        self, user_repository: UserRepository
+    ):
+        await user_repository.create(
+            UserCreate(
+                username="Streamed", email="streamed@example.com", description=""
+            )
+        )
+        _, total, _ = await user_repository.get_by_filter(1, 0)
+
+        batches = [batch async for batch in user_repository.stream(batch_size=2)]
+
+        assert all(len(batch) <= 2 for batch in batches)
+        rows = [row for batch in batches for row in batch]
+        assert len(rows) == total
+        assert "Streamed" in {row["username"] for row in rows}
+
+    @pytest.mark.asyncio
+    async def test_get_many_returns_found_users_by_id(
+        self, user_repository: UserRepository
+    ):
+        first = await user_repository.create(
+            UserCreate(username="Many1", email="many1@example.com", description="")
+        )
+        second = await user_repository.create(
+            UserCreate(username="Many2", email="many2@example.com", description="")
+        )
+        missing = uuid4()
+
+        found = await user_repository.get_many(
+            [first.id, missing, second.id, first.id], chunk_size=1
+        )
+
+        assert set(found) == {first.id, second.id}
+        assert found[second.id].username == "Many2"
+
+    @pytest.mark.asyncio
+    async def test_list_version_changes_on_update_and_delete(
+        self, user_repository: UserRepository
+    ):
+        user = await user_repository.create(
+            UserCreate(
+                username="Versioned", email="versioned@example.com", description=""
+            )
+        )
+        assert await user_repository.get_version(user.id) == user.updated_at
+        created = await user_repository.get_list_version()
+
+        await user_repository.update(user.id, UserUpdate(description="Versioned"))
+        updated = await user_repository.get_list_version()
+        await user_repository.delete(user.id)
+        deleted = await user_repository.get_list_version()
+
+        assert updated[0] > created[0]
+        assert deleted[1] == updated[1] - 1
+        assert await user_repository.get_version(user.id) is None
+
+    @pytest.mark.asyncio
+    async def test_projection_selects_only_requested_columns(
+        self, user_repository: UserRepository
+    ):
+        user = await user_repository.create(
+            UserCreate(
+                username="Projected", email="projected@example.com", description="x"
+            )
+        )
+
+        row = await user_repository.get_columns_by_id(user.id, ["username"])
+        users, _, _ = await user_repository.get_by_filter(
+            10, 0, columns=["email"], id__in=[user.id]
+        )
+        page, _ = await user_repository.get_by_cursor(
+            10, columns=["email"], id__in=[user.id]
+        )
+
+        assert row._fields == ("id", "created_at", "updated_at", "username")
+        assert row.username == "Projected"
+        assert users[0].email == "projected@example.com"
+        assert "username" not in users[0]._fields
+        assert page[0]._fields == ("id", "created_at", "updated_at", "email")
+
+    @pytest.mark.asyncio
+    async def test_core_read_mode_matches_orm_results(
+        self, user_repository: UserRepository
+    ):
+        await user_repository.create(
+            UserCreate(username="Corerow", email="corerow@example.com", description="")
+        )
+
+        orm_users, orm_total, _ = await user_repository.get_by_filter(50, 0)
+        core_users, core_total, _ = await user_repository.get_by_filter(
+            50, 0, read_mode=ReadMode.CORE
+        )
+        core_page, _ = await user_repository.get_by_cursor(50, read_mode=ReadMode.CORE)
+        found = await user_repository.get_many(
+            [user.id for user in orm_users], read_mode=ReadMode.CORE
+        )
+
+        assert core_total == orm_total
+        assert [row.username for row in core_users] == [
+            user.username for user in orm_users
+        ]
+        assert [row.id for row in core_page] == [user.id for user in orm_users]
+        assert set(found) == {user.id for user in orm_users}
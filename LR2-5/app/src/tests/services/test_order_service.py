@@ -107,3 +107,13 @@ class TestOrderService:
         mock_order_repository.reset_mock()
         await order_service.delete(sample_uuid)
         mock_order_repository.delete.assert_called_with(sample_uuid)
+
+    @pytest.mark.asyncio
+    async def test_detailed_reads_are_delegated(
+        self, order_service, mock_order_repository, sample_uuid
+    ):
+        await order_service.get_detailed(sample_uuid)
+        await order_service.get_all_detailed(count=100, page=2)
+
+        mock_order_repository.get_detailed.assert_called_once_with(sample_uuid)
+        mock_order_repository.get_all_detailed.assert_called_once_with(100, 2)
@@ -126,3 +126,20 @@ class TestUserService:
 
         await user_service.delete(sample_uuid)
         mock_user_repository.delete.assert_called_with(sample_uuid)
+
+    @pytest.mark.asyncio
+    async def test_get_by_cursor_returns_users_and_next_cursor(
+        self, user_service, mock_user_repository
+    ):
+        expected_users = [Mock(spec=User)]
+        mock_user_repository.get_by_cursor.return_value = (expected_users, "next")
+
+        result_users, next_cursor = await user_service.get_by_cursor(
+            count=1, cursor="current"
+        )
+
+        assert result_users == expected_users
+        assert next_cursor == "next"
+        mock_user_repository.get_by_cursor.assert_called_once_with(
+            count=1, cursor="current"
+        )